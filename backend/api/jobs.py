@@ -5,10 +5,12 @@ Provides endpoints for retrieving, updating, and deleting
 MRI processing jobs.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi.responses import Response
+import orjson
 from sqlalchemy.orm import Session
 
 from backend.core.database import get_db
@@ -26,28 +28,92 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
+def _without_none(job_dict: dict) -> dict:
+    """Drop unset (None) fields; in-progress jobs leave most optional fields empty."""
+    return {key: value for key, value in job_dict.items() if value is not None}
+
+
+def _job_detail_response(job: Job) -> Response:
+    """
+    Encode a job with its metrics as a JSON response.
+
+    Args:
+        job: Job instance
+
+    Returns:
+        JSON response with the job record and associated metrics
+    """
+    job_response = JobService.build_job_response(job)
+
+    # Convert to dictionary response
+    payload = orjson.dumps(_without_none({
+        "id": str(job_response.id),
+        "filename": job_response.filename,
+        "file_path": job_response.file_path,
+        "status": job_response.status.value,  # Convert enum to string
+        "error_message": job_response.error_message,
+        "created_at": job_response.created_at.isoformat(),
+        "started_at": job_response.started_at.isoformat() if job_response.started_at else None,
+        "completed_at": job_response.completed_at.isoformat() if job_response.completed_at else None,
+        "result_path": job_response.result_path,
+        "progress": job_response.progress,
+        "current_step": job_response.current_step,
+        "patient_name": job_response.patient_name,
+        "patient_id": job_response.patient_id,
+        "patient_age": job_response.patient_age,
+        "patient_sex": job_response.patient_sex,
+        "scanner_info": job_response.scanner_info,
+        "sequence_info": job_response.sequence_info,
+        "notes": job_response.notes,
+        "metrics": [metric.model_dump() for metric in job_response.metrics]
+    }))
+
+    return Response(content=payload, media_type="application/json")
+
+
+def _encode_cursor(job: Job) -> str:
+    """Encode a job's (created_at, id) sort key as an opaque page cursor."""
+    return f"{job.created_at.isoformat()}|{job.id}"
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a page cursor produced by _encode_cursor."""
+    created_at, sep, job_id = cursor.rpartition("|")
+    try:
+        if not sep or not job_id:
+            raise ValueError(cursor)
+        return datetime.fromisoformat(created_at), job_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
 @router.get("/")
 def list_jobs(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum records to return"),
     status: Optional[JobStatus] = Query(None, description="Filter by status"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (replaces skip)"),
     db: Session = Depends(get_db),
 ):
     """
     Retrieve a list of processing jobs.
 
-    Supports pagination and filtering by status.
+    Supports pagination and filtering by status. Pass the returned
+    next_cursor to fetch the following page; skip is kept for existing
+    clients but gets slower the deeper the page.
 
     Args:
         skip: Number of records to skip (for pagination)
         limit: Maximum number of records to return
         status: Optional status filter
+        cursor: Keyset cursor returned as next_cursor by the previous page
         db: Database session dependency
 
     Returns:
         List of job records
     """
-    jobs = JobService.get_jobs(db, skip=skip, limit=limit, status=status)
+    page_cursor = _decode_cursor(cursor) if cursor else None
+    jobs = JobService.get_jobs(db, skip=skip, limit=limit, status=status, cursor=page_cursor)
 
     # Convert Job objects to dictionaries for simple response
     result = []
@@ -72,9 +138,12 @@ def list_jobs(
             "sequence_info": job.sequence_info,
             "notes": job.notes,
         }
-        result.append(job_dict)
+        result.append(_without_none(job_dict))
+
+    # A full page may have more after it; a short page is the last one
+    next_cursor = _encode_cursor(jobs[-1]) if len(jobs) == limit else None
 
-    return {"jobs": result, "total": len(result), "skip": skip, "limit": limit}
+    return {"jobs": result, "total": len(result), "skip": skip, "limit": limit, "next_cursor": next_cursor}
 
 
 
@@ -99,34 +168,13 @@ def get_job_by_query(
     Raises:
         HTTPException: If job not found
     """
-    job_response = JobService.get_job_response(db, job_id)
+    job = JobService.get_job(db, job_id)
 
-    if not job_response:
+    if not job:
         logger.warning("job_not_found_by_query", job_id=job_id)
         raise HTTPException(status_code=404, detail=f"Job with ID '{job_id}' not found")
 
-    # Convert to dictionary response
-    return {
-        "id": str(job_response.id),
-        "filename": job_response.filename,
-        "file_path": job_response.file_path,
-        "status": job_response.status.value,  # Convert enum to string
-        "error_message": job_response.error_message,
-        "created_at": job_response.created_at.isoformat(),
-        "started_at": job_response.started_at.isoformat() if job_response.started_at else None,
-        "completed_at": job_response.completed_at.isoformat() if job_response.completed_at else None,
-        "result_path": job_response.result_path,
-        "progress": job_response.progress,
-        "current_step": job_response.current_step,
-        "patient_name": job_response.patient_name,
-        "patient_id": job_response.patient_id,
-        "patient_age": job_response.patient_age,
-        "patient_sex": job_response.patient_sex,
-        "scanner_info": job_response.scanner_info,
-        "sequence_info": job_response.sequence_info,
-        "notes": job_response.notes,
-        "metrics": [metric.dict() for metric in job_response.metrics]
-    }
+    return _job_detail_response(job)
 
 
 @router.get("/{job_id}")
@@ -147,34 +195,13 @@ def get_job(
     Raises:
         HTTPException: If job not found
     """
-    job_response = JobService.get_job_response(db, job_id)
+    job = JobService.get_job(db, job_id)
 
-    if not job_response:
+    if not job:
         logger.warning("job_not_found_by_path", job_id=job_id)
         raise HTTPException(status_code=404, detail=f"Job with ID '{job_id}' not found")
 
-    # Convert to dictionary response
-    return {
-        "id": str(job_response.id),
-        "filename": job_response.filename,
-        "file_path": job_response.file_path,
-        "status": job_response.status.value,  # Convert enum to string
-        "error_message": job_response.error_message,
-        "created_at": job_response.created_at.isoformat(),
-        "started_at": job_response.started_at.isoformat() if job_response.started_at else None,
-        "completed_at": job_response.completed_at.isoformat() if job_response.completed_at else None,
-        "result_path": job_response.result_path,
-        "progress": job_response.progress,
-        "current_step": job_response.current_step,
-        "patient_name": job_response.patient_name,
-        "patient_id": job_response.patient_id,
-        "patient_age": job_response.patient_age,
-        "patient_sex": job_response.patient_sex,
-        "scanner_info": job_response.scanner_info,
-        "sequence_info": job_response.sequence_info,
-        "notes": job_response.notes,
-        "metrics": [metric.dict() for metric in job_response.metrics]
-    }
+    return _job_detail_response(job)
 
 
 
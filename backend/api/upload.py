@@ -22,6 +22,7 @@ from backend.core.logging import get_logger, get_user_friendly_logger
 from backend.models import Job
 from backend.schemas import JobCreate, JobResponse, JobStatus
 from backend.services import JobService, StorageService
+from backend.services.job_queue_processor import wake_job_queue_processor
 
 logger = get_logger(__name__)
 user_logger = get_user_friendly_logger(__name__)
@@ -488,64 +489,18 @@ async def upload_mri(
 
         job = JobService.create_job(db, job_data)
 
-        # Trigger processing asynchronously
-        # Always call process_job_queue to ensure proper job starting logic
+        # Let an in-process queue processor (desktop mode) pick the job up right away
+        wake_job_queue_processor()
+
+        # Trigger processing asynchronously. process_job_queue claims the job
+        # before dispatching it; if it cannot, the job stays PENDING for the
+        # queue processor or the job monitor's next pass
         try:
             JobService.process_job_queue(db)
             logger.info("job_queue_processed_after_creation", job_id=str(job.id))
         except Exception as queue_error:
             logger.warning("job_queue_processing_failed_after_creation",
                          job_id=str(job.id), error=str(queue_error))
-
-            # Fallback: try to start job immediately if no running jobs
-            running_jobs_now = JobService.count_jobs_by_status(db, [JobStatus.RUNNING])
-            if running_jobs_now == 0:
-                try:
-                    # Submit Celery task for processing
-                    from workers.tasks.processing_web import process_mri_task
-                    # Submit to Celery queue
-                    task = process_mri_task.delay(str(job.id))
-                    logger.info("celery_task_submitted_fallback", job_id=str(job.id), celery_task_id=task.id)
-
-                except ImportError as e:
-                    logger.error("celery_import_failed", error=str(e))
-                    # Fallback to threading if Celery not available
-                    from backend.services.task_service import TaskService
-                    from workers.tasks.processing_desktop import process_mri_direct as process_mri_web
-
-                    def process_async():
-                        try:
-                            # Mark job as running
-                            JobService.start_job(db, str(job.id))
-
-                            # Skip actual processing for debug/test files
-                            if file.filename.startswith(('debug_test', 'test_minimal', 'test_format')):
-                                logger.info("processing_skipped_debug_file", job_id=str(job.id), filename=file.filename)
-                                JobService.update_job_status(db, str(job.id), 'completed')
-                                logger.info("debug_job_marked_completed", job_id=str(job.id))
-                                return
-
-                            logger.info("fallback_processing_starting", job_id=str(job.id))
-                            result = process_mri_web(str(job.id))
-                            logger.info("fallback_processing_completed", job_id=str(job.id), result=result)
-
-                        except Exception as e:
-                            logger.error("fallback_processing_failed", job_id=str(job.id), error=str(e), exc_info=True)
-
-                    TaskService.submit_task(process_async)
-
-                except Exception as task_error:
-                    # If task submission fails, log but don't fail the upload
-                    logger.error(
-                        "web_task_enqueue_failed",
-                        job_id=str(job.id),
-                        error=str(task_error),
-                        error_type=type(task_error).__name__,
-                    )
-        else:
-            # There's already a running job, this job stays in PENDING status
-            logger.info("job_queued_pending", job_id=str(job.id), reason="another_job_running")
-            # Don't raise - job is created successfully, just needs manual trigger
         
         logger.info(
             "upload_successful",
@@ -689,25 +644,30 @@ def _detect_file_corruption(file_data: bytes, filename: str) -> List[str]:
 
             zip_buffer = BytesIO(file_data)
             with zipfile.ZipFile(zip_buffer, 'r') as zip_file:
+                zip_entries = zip_file.infolist()
+
                 # Check if ZIP has any files
-                if len(zip_file.namelist()) == 0:
+                if len(zip_entries) == 0:
                     issues.append("ZIP file contains no files")
 
                 # Check for common DICOM extensions
-                dicom_files = [name for name in zip_file.namelist()
-                             if name.lower().endswith(('.dcm', '.dicom'))]
+                dicom_files = [info for info in zip_entries
+                             if info.filename.lower().endswith(('.dcm', '.dicom'))]
                 if len(dicom_files) == 0:
                     issues.append("ZIP file contains no DICOM files (.dcm or .dicom)")
 
-                # Test extraction of first file to check for corruption
+                # Check the first DICOM entry: emptiness from its central directory size,
+                # then a bounded read to surface decompression (and, for small files, CRC) errors
                 if dicom_files:
-                    try:
-                        with zip_file.open(dicom_files[0]) as first_file:
-                            test_data = first_file.read(1024)
-                            if len(test_data) == 0:
-                                issues.append("First DICOM file in ZIP appears to be empty")
-                    except Exception as e:
-                        issues.append(f"Cannot read first DICOM file in ZIP: {str(e)}")
+                    first_dicom = dicom_files[0]
+                    if first_dicom.file_size == 0:
+                        issues.append("First DICOM file in ZIP appears to be empty")
+                    else:
+                        try:
+                            with zip_file.open(first_dicom) as first_file:
+                                first_file.read(1024)
+                        except Exception as e:
+                            issues.append(f"Cannot read first DICOM file in ZIP: {str(e)}")
 
         except (zipfile.BadZipFile, Exception) as e:
             issues.append(f"ZIP file appears to be corrupted: {str(e)}")
@@ -720,9 +680,13 @@ def _detect_file_corruption(file_data: bytes, filename: str) -> List[str]:
 
     # Check for repetitive patterns (could indicate corruption)
     if len(file_data) > 1000:
-        # Sample every 100th byte for 10 samples
-        samples = file_data[::100][:10]
-        if len(set(samples)) <= 2:  # If mostly the same values
+        import numpy as np
+
+        # Byte histogram over ~4096 evenly strided samples of a zero-copy view
+        byte_view = np.frombuffer(file_data, dtype=np.uint8)
+        samples = byte_view[::max(1, byte_view.size // 4096)]
+        distinct_bytes = np.count_nonzero(np.bincount(samples, minlength=256))
+        if distinct_bytes <= 2:  # If mostly the same values
             issues.append("File contains repetitive byte patterns (possibly corrupted)")
 
     return issues
@@ -4,11 +4,17 @@ API routes for serving segmentation visualizations.
 Provides endpoints to retrieve NIfTI files and images for web viewers.
 """
 
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import get_context
 from pathlib import Path
+from typing import Any, Optional, Tuple
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import FileResponse, Response
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from sqlalchemy.orm import Session
 
 from backend.core.config import get_settings
@@ -22,8 +28,179 @@ settings = get_settings()
 
 router = APIRouter(prefix="/visualizations", tags=["visualizations"])
 
+# Job outputs root, resolved once at import instead of on every request
+BASE_OUTPUT_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "outputs"
 
-def _generate_overlay_image(job_id: str, slice_id: str, orientation: str, layer: str, output_path: Path) -> bool:
+
+@lru_cache(maxsize=1024)
+def _viz_dir(job_id: str, *subdirs: str) -> Path:
+    """Get (and memoize) a job's visualization directory, e.g. _viz_dir(job_id, "subfields")."""
+    return BASE_OUTPUT_DIR.joinpath(job_id, "visualizations", *subdirs)
+
+
+# Chunk size used when streaming a byte range of a NIfTI file
+RANGE_CHUNK_SIZE = 1024 * 1024
+
+
+def _parse_range_header(range_header: str, file_size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range HTTP Range header.
+
+    Args:
+        range_header: Value of the Range header (e.g., 'bytes=0-1023')
+        file_size: Size of the requested file in bytes
+
+    Returns:
+        Inclusive (start, end) byte offsets, or None if the header should be
+        ignored and the full file served (malformed or multi-range requests)
+
+    Raises:
+        HTTPException: 416 if the range cannot be satisfied
+    """
+    unit, _, ranges = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+
+    start_str, _, end_str = ranges.strip().partition("-")
+    try:
+        if start_str:
+            start = int(start_str)
+            end = int(end_str) if end_str else file_size - 1
+        else:
+            # Suffix range: last N bytes of the file
+            start = max(file_size - int(end_str), 0)
+            end = file_size - 1
+    except ValueError:
+        return None
+
+    if start >= file_size or start > end:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{file_size}"},
+        )
+
+    return start, min(end, file_size - 1)
+
+
+def _iter_file_range(path: Path, start: int, end: int):
+    """Yield the bytes of path between start and end (inclusive)."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(RANGE_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _nifti_file_response(path: Path, request: Request, filename: str) -> Response:
+    """
+    Serve a NIfTI file, honoring a single HTTP Range request.
+
+    Requests without a Range header get a plain FileResponse, which uses
+    sendfile; ranged requests get a 206 with only the requested bytes.
+    """
+    headers = {
+        "Content-Disposition": f'inline; filename="{filename}"',
+        "Accept-Ranges": "bytes"
+    }
+
+    range_header = request.headers.get("range")
+    if range_header:
+        file_size = os.path.getsize(path)
+        byte_range = _parse_range_header(range_header, file_size)
+        if byte_range is not None:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+            headers["Content-Length"] = str(end - start + 1)
+            return StreamingResponse(
+                _iter_file_range(path, start, end),
+                status_code=206,
+                media_type="application/octet-stream",
+                headers=headers,
+            )
+
+    return FileResponse(
+        path=path,
+        media_type="application/octet-stream",
+        headers=headers,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_overlay_pool() -> ProcessPoolExecutor:
+    """
+    Get the process pool used for on-demand overlay generation.
+
+    NIfTI decompression and NumPy slicing hold the GIL, so they run in
+    child processes; the pool is created on first use. Workers are spawned
+    rather than forked so they never inherit the server's threads, locks or
+    database connections. The pool size comes from the overlay_workers
+    setting rather than the core count, since every worker keeps its own
+    decoded volumes in memory and competes with running jobs for CPU.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max(1, settings.overlay_workers),
+        mp_context=get_context("spawn"),
+    )
+
+
+def shutdown_overlay_pool() -> None:
+    """Shut down the overlay process pool, if it was started."""
+    if _get_overlay_pool.cache_info().currsize:
+        _get_overlay_pool().shutdown(wait=True, cancel_futures=True)
+        _get_overlay_pool.cache_clear()
+
+
+# Volumes kept open per pool worker: path -> ((st_mtime_ns, st_ino), image)
+VOLUME_CACHE_SIZE = 8
+_volume_cache: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+
+
+def _file_version(path: str) -> Optional[Tuple[int, int]]:
+    """Identify the current contents of path by (st_mtime_ns, st_ino), or None if it is gone."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_ino
+
+
+def _load_volume(path: str):
+    """
+    Load a NIfTI/MGZ volume, keeping its file handle open across slice reads.
+
+    With indexed_gzip installed nibabel seeks inside gzipped volumes instead
+    of decompressing from the start, and the open handle keeps the seek index
+    alive between requests handled by the same pool worker. Cached volumes
+    are checked against the file's mtime and inode on every call, so a
+    re-processed job is read afresh and handles to replaced or deleted files
+    are released.
+    """
+    import nibabel as nib
+
+    for cached_path, (version, _) in list(_volume_cache.items()):
+        if _file_version(cached_path) != version:
+            del _volume_cache[cached_path]
+
+    cached = _volume_cache.get(path)
+    if cached is not None:
+        _volume_cache.move_to_end(path)
+        return cached[1]
+
+    version = _file_version(path)
+    img = nib.load(path, keep_file_open=True)
+    if version is not None:
+        _volume_cache[path] = (version, img)
+        while len(_volume_cache) > VOLUME_CACHE_SIZE:
+            _volume_cache.popitem(last=False)
+    return img
+
+
+def _generate_overlay_image(job_id: str, slice_id: str, orientation: str, layer: str, output_path: str) -> bool:
     """
     Generate PNG overlay image on-demand from NIfTI files.
 
@@ -48,7 +225,7 @@ def _generate_overlay_image(job_id: str, slice_id: str, orientation: str, layer:
         return False
 
     # Find output directory - check both FastSurfer and FreeSurfer locations
-    base_output_dir = Path(Path(__file__).parent.parent.parent / "data" / "outputs") / str(job_id)
+    base_output_dir = BASE_OUTPUT_DIR / str(job_id)
 
     # Try FastSurfer first (preferred)
     job_output_dir = base_output_dir / "fastsurfer"
@@ -78,6 +255,19 @@ def _generate_overlay_image(job_id: str, slice_id: str, orientation: str, layer:
         return False
 
     try:
+        # Extract slice number from slice_id (e.g. 'slice_03' -> 3)
+        slice_num = int(slice_id.split('_')[1])
+
+        if orientation == "axial":
+            slice_index = (slice(None), slice(None), slice_num)
+        elif orientation == "sagittal":
+            slice_index = (slice_num, slice(None), slice(None))
+        elif orientation == "coronal":
+            slice_index = (slice(None), slice_num, slice(None))
+        else:
+            logger.error("unsupported_orientation", orientation=orientation)
+            return False
+
         if layer == "anatomical":
             # Try to find anatomical T1 image
             anatomical_paths = [
@@ -89,7 +279,7 @@ def _generate_overlay_image(job_id: str, slice_id: str, orientation: str, layer:
 
             anatomical_file = None
             for path in anatomical_paths:
-                if path.exists():
+                if os.path.isfile(path):
                     anatomical_file = path
                     break
 
@@ -97,9 +287,16 @@ def _generate_overlay_image(job_id: str, slice_id: str, orientation: str, layer:
                 logger.error("anatomical_file_not_found", job_id=job_id)
                 return False
 
-            # Load and process anatomical image
-            img = nib.load(str(anatomical_file))
-            data = img.get_fdata()
+            # Read only the requested slice from the array proxy
+            img = _load_volume(str(anatomical_file))
+            slice_data = np.asanyarray(img.dataobj[slice_index], dtype=np.float32)
+
+            # Normalize anatomical data to 0-255 range
+            slice_normalized = ((slice_data - slice_data.min()) /
+                              (slice_data.max() - slice_data.min()) * 255).astype(np.uint8)
+
+            # Create grayscale image
+            img_pil = Image.fromarray(slice_normalized, mode='L').convert('RGB')
 
         else:  # overlay
             # Try to find segmentation file
@@ -111,7 +308,7 @@ def _generate_overlay_image(job_id: str, slice_id: str, orientation: str, layer:
 
             seg_file = None
             for path in seg_paths:
-                if path.exists():
+                if os.path.isfile(path):
                     seg_file = path
                     break
 
@@ -119,55 +316,18 @@ def _generate_overlay_image(job_id: str, slice_id: str, orientation: str, layer:
                 logger.error("segmentation_file_not_found", job_id=job_id)
                 return False
 
-            # Load segmentation
-            seg_img = nib.load(str(seg_file))
-            seg_data = seg_img.get_fdata()
+            # Segmentation labels are integers - read the slice as int16, never as float64
+            seg_img = _load_volume(str(seg_file))
+            seg_slice = np.asanyarray(seg_img.dataobj[slice_index], dtype=np.int16)
 
             # Create hippocampus mask (labels 17 and 53 are left/right hippocampus in FreeSurfer)
-            hippocampus_mask = ((seg_data == 17) | (seg_data == 53)).astype(np.uint8)
-
-            # For overlay, we'll create a colored mask on transparent background
-            data = np.zeros((*hippocampus_mask.shape, 4), dtype=np.uint8)
-            # Set hippocampus regions to semi-transparent red
-            data[hippocampus_mask == 1] = [255, 0, 0, 128]  # Red with 50% transparency
-
-        # Extract slice based on orientation
-        slice_num = int(slice_id.split('_')[1])  # Extract number from 'slice_03'
-
-        if orientation == "axial":
-            slice_data = data[:, :, slice_num] if layer == "anatomical" else data[:, :, slice_num]
-        elif orientation == "sagittal":
-            slice_data = data[slice_num, :, :] if layer == "anatomical" else data[slice_num, :, :]
-        elif orientation == "coronal":
-            slice_data = data[:, slice_num, :] if layer == "anatomical" else data[:, slice_num, :]
-        else:
-            logger.error("unsupported_orientation", orientation=orientation)
-            return False
+            hippocampus_mask = (seg_slice == 17) | (seg_slice == 53)
 
-        # Convert to PIL Image
-        if layer == "anatomical":
-            # Normalize anatomical data to 0-255 range
-            slice_normalized = ((slice_data - slice_data.min()) /
-                              (slice_data.max() - slice_data.min()) * 255).astype(np.uint8)
+            # Colored mask on transparent background, hippocampus in semi-transparent red
+            rgba = np.zeros((*hippocampus_mask.shape, 4), dtype=np.uint8)
+            rgba[hippocampus_mask] = (255, 0, 0, 128)
 
-            # Create grayscale image
-            img_pil = Image.fromarray(slice_normalized, mode='L').convert('RGB')
-        else:
-            # Create RGBA image for overlay
-            height, width = slice_data.shape[:2]
-            img_pil = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-
-            # Apply the overlay data
-            overlay_pixels = img_pil.load()
-            for y in range(height):
-                for x in range(width):
-                    if len(slice_data.shape) > 2 and slice_data.shape[2] == 4:
-                        # RGBA data
-                        r, g, b, a = slice_data[y, x]
-                        overlay_pixels[x, y] = (r, g, b, a)
-                    elif slice_data[y, x] > 0:
-                        # Binary mask - make red with transparency
-                        overlay_pixels[x, y] = (255, 0, 0, 128)
+            img_pil = Image.fromarray(rgba, mode='RGBA')
 
         # Save the image
         img_pil.save(str(output_path), 'PNG')
@@ -183,6 +343,7 @@ def _generate_overlay_image(job_id: str, slice_id: str, orientation: str, layer:
 @router.get("/{job_id}/whole-hippocampus/anatomical")
 def get_anatomical_t1(
     job_id: UUID,
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
@@ -190,6 +351,7 @@ def get_anatomical_t1(
     
     Args:
         job_id: Job identifier
+        request: FastAPI request object (for Range support)
         db: Database session dependency
     
     Returns:
@@ -207,27 +369,21 @@ def get_anatomical_t1(
         raise HTTPException(status_code=400, detail="Job not yet completed")
     
     # Construct path to T1 file
-    viz_dir = Path(Path(__file__).parent.parent.parent / "data" / "outputs") / str(job_id) / "visualizations" / "whole_hippocampus"
+    viz_dir = _viz_dir(str(job_id), "whole_hippocampus")
     t1_path = viz_dir / "anatomical.nii.gz"
     
-    if not t1_path.exists():
+    if not os.path.isfile(t1_path):
         raise HTTPException(status_code=404, detail="Anatomical image not found")
     
     logger.info("serving_anatomical_t1", job_id=str(job_id))
     
-    return FileResponse(
-        path=t1_path,
-        media_type="application/octet-stream",
-        headers={
-            "Content-Disposition": f'inline; filename="{job_id}_anatomical.nii.gz"',
-            "Accept-Ranges": "bytes"
-        }
-    )
+    return _nifti_file_response(t1_path, request, f"{job_id}_anatomical.nii.gz")
 
 
 @router.get("/{job_id}/whole-hippocampus/nifti")
 def get_whole_hippocampus_nifti(
     job_id: UUID,
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
@@ -235,6 +391,7 @@ def get_whole_hippocampus_nifti(
     
     Args:
         job_id: Job identifier
+        request: FastAPI request object (for Range support)
         db: Database session dependency
     
     Returns:
@@ -252,22 +409,15 @@ def get_whole_hippocampus_nifti(
         raise HTTPException(status_code=400, detail="Job not yet completed")
     
     # Construct path to visualization files
-    viz_dir = Path(Path(__file__).parent.parent.parent / "data" / "outputs") / str(job_id) / "visualizations" / "whole_hippocampus"
+    viz_dir = _viz_dir(str(job_id), "whole_hippocampus")
     nifti_path = viz_dir / "segmentation.nii.gz"
     
-    if not nifti_path.exists():
+    if not os.path.isfile(nifti_path):
         raise HTTPException(status_code=404, detail="Segmentation file not found")
     
     logger.info("serving_whole_hippocampus_nifti", job_id=str(job_id))
     
-    return FileResponse(
-        path=nifti_path,
-        media_type="application/octet-stream",
-        headers={
-            "Content-Disposition": f'inline; filename="{job_id}_whole_hippocampus.nii.gz"',
-            "Accept-Ranges": "bytes"
-        }
-    )
+    return _nifti_file_response(nifti_path, request, f"{job_id}_whole_hippocampus.nii.gz")
 
 
 @router.get("/{job_id}/whole-hippocampus/metadata")
@@ -295,10 +445,10 @@ def get_whole_hippocampus_metadata(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    viz_dir = Path(Path(__file__).parent.parent.parent / "data" / "outputs") / str(job_id) / "visualizations" / "whole_hippocampus"
+    viz_dir = _viz_dir(str(job_id), "whole_hippocampus")
     metadata_path = viz_dir / "segmentation_metadata.json"
     
-    if not metadata_path.exists():
+    if not os.path.isfile(metadata_path):
         raise HTTPException(status_code=404, detail="Metadata not found")
     
     with open(metadata_path, 'r') as f:
@@ -310,6 +460,7 @@ def get_whole_hippocampus_metadata(
 @router.get("/{job_id}/subfields/nifti")
 def get_subfields_nifti(
     job_id: UUID,
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
@@ -317,6 +468,7 @@ def get_subfields_nifti(
     
     Args:
         job_id: Job identifier
+        request: FastAPI request object (for Range support)
         db: Database session dependency
     
     Returns:
@@ -333,22 +485,15 @@ def get_subfields_nifti(
     if job.status != JobStatus.COMPLETED:
         raise HTTPException(status_code=400, detail="Job not yet completed")
     
-    viz_dir = Path(Path(__file__).parent.parent.parent / "data" / "outputs") / str(job_id) / "visualizations" / "subfields"
+    viz_dir = _viz_dir(str(job_id), "subfields")
     nifti_path = viz_dir / "segmentation.nii.gz"
     
-    if not nifti_path.exists():
+    if not os.path.isfile(nifti_path):
         raise HTTPException(status_code=404, detail="Subfields segmentation not found")
     
     logger.info("serving_subfields_nifti", job_id=str(job_id))
     
-    return FileResponse(
-        path=nifti_path,
-        media_type="application/octet-stream",
-        headers={
-            "Content-Disposition": f'inline; filename="{job_id}_subfields.nii.gz"',
-            "Accept-Ranges": "bytes"
-        }
-    )
+    return _nifti_file_response(nifti_path, request, f"{job_id}_subfields.nii.gz")
 
 
 @router.get("/{job_id}/subfields/metadata")
@@ -376,10 +521,10 @@ def get_subfields_metadata(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    viz_dir = Path(Path(__file__).parent.parent.parent / "data" / "outputs") / str(job_id) / "visualizations" / "subfields"
+    viz_dir = _viz_dir(str(job_id), "subfields")
     metadata_path = viz_dir / "segmentation_metadata.json"
     
-    if not metadata_path.exists():
+    if not os.path.isfile(metadata_path):
         raise HTTPException(status_code=404, detail="Metadata not found")
     
     with open(metadata_path, 'r') as f:
@@ -434,8 +579,7 @@ def get_overlay_image(
         raise HTTPException(status_code=400, detail="Job not yet completed")
 
     # Try to find existing PNG first, then generate on-demand
-    viz_dir = Path(Path(__file__).parent.parent.parent / "data" / "outputs") / str(job_id) / "visualizations" / "overlays" / orientation
-    viz_dir.mkdir(parents=True, exist_ok=True)
+    viz_dir = _viz_dir(str(job_id), "overlays", orientation)
 
     # Extract slice number from slice_id (format: "slice_00" -> 0)
     try:
@@ -449,13 +593,17 @@ def get_overlay_image(
     else:
         image_path = viz_dir / f"hippocampus_overlay_slice_{slice_str}.png"
 
-    logger.info("checking_image_path", path=str(image_path), exists=image_path.exists())
+    image_exists = os.path.isfile(image_path)
+    logger.info("checking_image_path", path=str(image_path), exists=image_exists)
 
     # If image doesn't exist, try to generate it from NIfTI files
-    if not image_path.exists():
+    if not image_exists:
         logger.info("generating_image_on_demand", job_id=str(job_id), slice=slice_id, layer=layer)
         try:
-            success = _generate_overlay_image(job_id, slice_id, orientation, layer, image_path)
+            viz_dir.mkdir(parents=True, exist_ok=True)
+            success = _get_overlay_pool().submit(
+                _generate_overlay_image, job_id, slice_id, orientation, layer, str(image_path)
+            ).result()
             if not success:
                 logger.error("image_generation_failed", job_id=str(job_id), slice=slice_id, layer=layer)
                 if is_head_request:
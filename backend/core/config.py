@@ -12,9 +12,9 @@ import platform
 import tempfile
 from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings
 
 
@@ -51,6 +51,13 @@ class Settings(BaseSettings):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # Update CORS origins to include the current API port
+        if hasattr(self, 'api_port') and self.api_port != 8000:
+            dynamic_origins = f"http://localhost:{self.api_port},http://127.0.0.1:{self.api_port}"
+            if self.cors_origins:
+                self.cors_origins = f"{self.cors_origins},{dynamic_origins}"
+            else:
+                self.cors_origins = dynamic_origins
         # Ensure storage directories exist
         self._ensure_storage_directories()
 
@@ -59,6 +66,7 @@ class Settings(BaseSettings):
     app_version: str = "1.0.0"
     environment: str = Field(default="development", env="ENVIRONMENT")
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
+    log_sql: bool = Field(default=False, env="LOG_SQL")  # Echo SQL statements (debugging only)
 
     # API Configuration
     api_host: str = Field(default="0.0.0.0", env="API_HOST")
@@ -72,16 +80,6 @@ class Settings(BaseSettings):
     api_bridge_url: str = Field(default="http://localhost:8080", env="API_BRIDGE_URL")
     use_real_freesurfer: bool = Field(default=False, env="USE_REAL_FREESURFER")
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Update CORS origins to include the current API port
-        if hasattr(self, 'api_port') and self.api_port != 8000:
-            dynamic_origins = f"http://localhost:{self.api_port},http://127.0.0.1:{self.api_port}"
-            if self.cors_origins:
-                self.cors_origins = f"{self.cors_origins},{dynamic_origins}"
-            else:
-                self.cors_origins = dynamic_origins
-
     # File Storage - Platform-aware defaults (no manual setup required)
     upload_dir: str = Field(default_factory=lambda: get_platform_defaults()["upload_dir"], env="UPLOAD_DIR")
     output_dir: str = Field(default_factory=lambda: get_platform_defaults()["output_dir"], env="OUTPUT_DIR")
@@ -95,6 +93,10 @@ class Settings(BaseSettings):
     postgres_password: str = Field(default="secure_password_change_in_production", env="POSTGRES_PASSWORD")
     postgres_db: str = Field(default="neuroinsight", env="POSTGRES_DB")
 
+    # PostgreSQL connection pool sizing
+    db_pool_size: int = Field(default=25, env="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=50, env="DB_MAX_OVERFLOW")
+
     # Storage Configuration (MinIO/S3)
     minio_endpoint: str = Field(default="localhost:9000", env="MINIO_ENDPOINT")
     minio_access_key: str = Field(default="minioadmin", env="MINIO_ACCESS_KEY")
@@ -112,13 +114,26 @@ class Settings(BaseSettings):
     )
     processing_timeout: int = Field(default=36000, env="PROCESSING_TIMEOUT")  # 10 hours
     max_concurrent_jobs: int = Field(default=1, env="MAX_CONCURRENT_JOBS")  # Only 1 job running at a time
+    # Size output storage with a single `find` call instead of walking it in Python
+    fast_storage_stats: bool = Field(default=True, env="FAST_STORAGE_STATS")
+    # Processes rendering viewer overlays on demand; each holds decoded volumes in memory
+    overlay_workers: int = Field(default=2, env="OVERLAY_WORKERS")
 
     # Security
     secret_key: str = Field(default="dev-secret-key-change-me", env="SECRET_KEY")
 
+    # Derived values, computed on first access and reused for the lifetime of the instance
+    _database_url: Optional[str] = PrivateAttr(default=None)
+    _cors_origins_list: Optional[List[str]] = PrivateAttr(default=None)
+
     @property
     def cors_origins_list(self) -> List[str]:
         """Parse CORS origins from comma-separated string."""
+        if self._cors_origins_list is None:
+            self._cors_origins_list = self._parse_cors_origins()
+        return self._cors_origins_list
+
+    def _parse_cors_origins(self) -> List[str]:
         if isinstance(self.cors_origins, str):
             # Handle wildcard - if set to "*", return ["*"] for FastAPI
             if self.cors_origins.strip() == "*":
@@ -129,8 +144,10 @@ class Settings(BaseSettings):
     def _ensure_storage_directories(self):
         """Ensure upload and output directories exist."""
         try:
-            Path(self.upload_dir).mkdir(parents=True, exist_ok=True)
-            Path(self.output_dir).mkdir(parents=True, exist_ok=True)
+            for directory in (self.upload_dir, self.output_dir):
+                path = Path(directory)
+                if not path.is_dir():
+                    path.mkdir(parents=True, exist_ok=True)
         except Exception as e:
             # If we can't create the directories, log warning but don't fail
             print(f"Warning: Could not create storage directories: {e}")
@@ -143,7 +160,13 @@ class Settings(BaseSettings):
         Database URL with PostgreSQL support for native deployment.
 
         Tests PostgreSQL connection and falls back to SQLite if unavailable.
+        The probe runs once per Settings instance; later reads return the cached URL.
         """
+        if self._database_url is None:
+            self._database_url = self._resolve_database_url()
+        return self._database_url
+
+    def _resolve_database_url(self) -> str:
         # Production mode: Check if PostgreSQL containers are running
         try:
             import subprocess
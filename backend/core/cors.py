@@ -0,0 +1,119 @@
+"""
+Pure ASGI CORS middleware.
+
+Follows the layout of Starlette's CORSMiddleware, but every header that
+does not depend on the request is built once at construction time and
+requests are handled on raw ASGI header lists, without creating
+Request/Headers/Response objects per request.
+"""
+
+from typing import Iterable, List, Tuple
+
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+
+# Seconds browsers may cache a preflight response (Starlette's default)
+PREFLIGHT_MAX_AGE = 600
+
+Header = Tuple[bytes, bytes]
+
+
+class FastCORSMiddleware:
+    """
+    CORS middleware with the allowed-origin decision and headers precomputed.
+
+    All methods and request headers are allowed. With origins ["*"] every
+    origin is accepted; with allow_credentials the request's origin is echoed
+    back instead of "*", as browsers reject a wildcard on credentialed requests.
+    """
+
+    def __init__(self, app, origins: Iterable[str] = (), allow_credentials: bool = False) -> None:
+        self.app = app
+        origins = list(origins)
+        self.allow_all_origins = "*" in origins
+        self.allow_origins = frozenset(origin.encode("latin-1") for origin in origins)
+        self.allow_credentials = allow_credentials
+        # Echo the origin unless any origin may read the response without credentials
+        self.echo_origin = allow_credentials or not self.allow_all_origins
+
+        simple_headers: List[Header] = []
+        if allow_credentials:
+            simple_headers.append((b"access-control-allow-credentials", b"true"))
+        if self.echo_origin:
+            simple_headers.append((b"vary", b"Origin"))
+        self.simple_headers = tuple(simple_headers)
+
+        self.preflight_headers = self.simple_headers + (
+            (b"access-control-allow-methods", ", ".join(ALL_METHODS).encode("latin-1")),
+            (b"access-control-max-age", str(PREFLIGHT_MAX_AGE).encode("latin-1")),
+        )
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            # Not a cross-origin request
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self.preflight_response(origin, request_headers, send)
+            return
+
+        await self.simple_response(scope, receive, send, origin)
+
+    def is_allowed_origin(self, origin: bytes) -> bool:
+        return self.allow_all_origins or origin in self.allow_origins
+
+    def allow_origin_header(self, origin: bytes) -> Header:
+        return (b"access-control-allow-origin", origin if self.echo_origin else b"*")
+
+    async def preflight_response(self, origin: bytes, request_headers, send) -> None:
+        if not self.is_allowed_origin(origin):
+            body = b"Disallowed CORS origin"
+            await send({
+                "type": "http.response.start",
+                "status": 400,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        headers = [self.allow_origin_header(origin), *self.preflight_headers]
+        if request_headers is not None:
+            # All headers are allowed, so mirror what the browser asked for
+            headers.append((b"access-control-allow-headers", request_headers))
+        headers.append((b"content-type", b"text/plain; charset=utf-8"))
+        headers.append((b"content-length", b"2"))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"OK"})
+
+    async def simple_response(self, scope, receive, send, origin: bytes) -> None:
+        if not self.is_allowed_origin(origin):
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = (self.allow_origin_header(origin), *self.simple_headers)
+
+        async def send_with_cors(message) -> None:
+            if message["type"] == "http.response.start":
+                # A repeated Vary field line is equivalent to a merged one
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
@@ -8,9 +8,8 @@ session management, and base model class.
 from typing import Generator
 
 import sqlalchemy.pool
-from sqlalchemy import create_engine, text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from .config import get_settings
 from .logging import get_logger
@@ -38,26 +37,49 @@ elif "postgresql" in settings.database_url:
 
     # PostgreSQL connection pool settings
     pool_kwargs = {
-        "pool_size": 10,          # Base pool size
-        "max_overflow": 20,       # Additional connections allowed
+        "pool_size": settings.db_pool_size,          # Base pool size
+        "max_overflow": settings.db_max_overflow,    # Additional connections allowed
         "pool_timeout": 30,       # Connection timeout
         "pool_recycle": 3600,     # Recycle connections after 1 hour
         "pool_pre_ping": True,    # Test connections before use
+        "pool_use_lifo": True,    # Reuse the most recent connection, let idle ones age out
     }
 
 engine = create_engine(
     settings.database_url,
     poolclass=pool_class,
-    echo=settings.environment == "development",
+    echo=settings.log_sql,
     connect_args=connect_args,
     **pool_kwargs
 )
 
+# Applied to every new SQLite connection. WAL lets readers proceed while a
+# write is in progress and, with synchronous=NORMAL, commits skip the fsync
+# (the WAL is synced at checkpoints). foreign_keys makes ON DELETE CASCADE
+# remove a job's metrics.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+)
+
+if settings.database_url.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Configure journaling, durability and foreign keys for a new connection."""
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Create base class for models
-Base = declarative_base()
+# Base class for models (SQLAlchemy 2.0 declarative API)
+class Base(DeclarativeBase):
+    pass
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -65,7 +87,9 @@ def get_db() -> Generator[Session, None, None]:
     Database session dependency for FastAPI.
     
     Yields a database session and ensures it's closed after the request.
-    Use this as a dependency in FastAPI route handlers.
+    Use this as a dependency in FastAPI route handlers. No per-request
+    liveness query is issued: stale PostgreSQL connections are detected by
+    the pool's pre-ping at checkout, and SQLite opens a fresh connection.
     
     Example:
         @app.get("/jobs")
@@ -75,15 +99,15 @@ def get_db() -> Generator[Session, None, None]:
     Yields:
         Session: SQLAlchemy database session
     """
+    # Deliberately a plain per-request Session rather than a thread-local
+    # scoped_session: FastAPI may run this dependency's setup, the endpoint
+    # and the teardown on different threadpool threads, so a thread-keyed
+    # registry could hand the same Session to two concurrent requests.
+    db = SessionLocal()
     try:
-        db = SessionLocal()
         yield db
     finally:
-        if db:
-            try:
-                db.close()
-            except:
-                pass
+        db.close()
 
 
 def init_db() -> None:
@@ -100,3 +124,8 @@ def init_db() -> None:
     
     Base.metadata.create_all(bind=engine)
 
+    # create_all() skips tables that already exist, so indexes added to an
+    # existing table are created here as well (idempotent on SQLite and PostgreSQL)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_jobs_created_at_id ON jobs (created_at, id)"))
+
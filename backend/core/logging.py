@@ -5,10 +5,14 @@ This module sets up JSON-formatted structured logging for production
 environments and human-readable logging for development.
 """
 
+import atexit
 import logging
 import sys
-from typing import Any, Dict, Optional
+import threading
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, Optional, Tuple
 
+import orjson
 import structlog
 
 
@@ -18,7 +22,7 @@ class UserFriendlyLogger:
     """
 
     def __init__(self, name: str):
-        self.logger = structlog.get_logger(name)
+        self.logger = get_logger(name)
 
     def error_with_user_message(self, error: Exception, user_message: str, **kwargs):
         """
@@ -70,6 +74,7 @@ class UserFriendlyLogger:
         )
 
 
+@lru_cache(maxsize=None)
 def get_user_friendly_logger(name: str) -> UserFriendlyLogger:
     """
     Get a user-friendly logger instance.
@@ -83,19 +88,99 @@ def get_user_friendly_logger(name: str) -> UserFriendlyLogger:
     return UserFriendlyLogger(name)
 
 
+# Buffer size for production JSON log output; small lines are coalesced into one write()
+LOG_BUFFER_SIZE = 8192
+
+_log_write_lock = threading.Lock()
+
+# (log_level, environment) of the active structlog configuration
+_active_config: Optional[Tuple[str, str]] = None
+
+
+@lru_cache(maxsize=1)
+def _get_log_stream() -> BinaryIO:
+    """
+    Get the block-buffered binary stream production logs are written to.
+
+    The stream is opened once on stdout's file descriptor and flushed at exit.
+    """
+    try:
+        stream = open(sys.stdout.fileno(), "wb", buffering=LOG_BUFFER_SIZE, closefd=False)
+    except (AttributeError, OSError, ValueError):
+        # stdout has been replaced (e.g. captured by a test runner)
+        stream = sys.stdout.buffer
+    atexit.register(stream.flush)
+    return stream
+
+
+class BufferedBytesLogger:
+    """
+    structlog logger that writes rendered bytes without flushing per event.
+
+    Events at warning level and above flush the buffer immediately so
+    problems are visible right away; lower levels are flushed when the
+    buffer fills, at shutdown, or by the next warning.
+    """
+
+    def __init__(self, file: BinaryIO, name: Optional[str] = None):
+        self._file = file
+        self.name = name  # Read by structlog.stdlib.add_logger_name
+
+    def msg(self, message: bytes) -> None:
+        with _log_write_lock:
+            self._file.write(message + b"\n")
+
+    log = debug = info = msg
+
+    def msg_and_flush(self, message: bytes) -> None:
+        with _log_write_lock:
+            self._file.write(message + b"\n")
+            self._file.flush()
+
+    warn = warning = err = error = critical = exception = fatal = failure = msg_and_flush
+
+
+class BufferedBytesLoggerFactory:
+    """Produce BufferedBytesLogger instances sharing the production log stream."""
+
+    def __call__(self, *args: Any) -> BufferedBytesLogger:
+        return BufferedBytesLogger(_get_log_stream(), name=args[0] if args else None)
+
+
+def flush_logs() -> None:
+    """Flush buffered production log output (call on shutdown)."""
+    with _log_write_lock:
+        _get_log_stream().flush()
+
+
 def setup_logging(log_level: str = "INFO", environment: str = "development") -> None:
     """
     Configure structured logging for the application.
-    
+
+    Production renders events to JSON bytes with orjson and writes them
+    to a buffered stdout stream, bypassing the stdlib logging machinery. The stdlib
+    root logger is still configured for third-party libraries (uvicorn, etc.).
+
+    Calling it again with the same level and environment is a no-op, so
+    loggers cached on first use stay valid across lifespan restarts.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         environment: Application environment (development, production)
     """
+    global _active_config
+
+    config_key = (log_level.upper(), environment)
+    if _active_config == config_key:
+        return
+
+    level = getattr(logging, log_level.upper())
+
     # Configure standard logging
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
+        level=level,
     )
     
     # Shared processors for all environments
@@ -110,30 +195,38 @@ def setup_logging(log_level: str = "INFO", environment: str = "development") ->
     
     # Environment-specific processors
     if environment == "production":
-        # JSON logging for production
+        # JSON logging for production, rendered to bytes and written directly
         processors = shared_processors + [
             structlog.processors.dict_tracebacks,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=orjson.dumps),
         ]
+        wrapper_class = structlog.make_filtering_bound_logger(level)
+        logger_factory = BufferedBytesLoggerFactory()
     else:
         # Pretty console logging for development
         processors = shared_processors + [
             structlog.dev.ConsoleRenderer(colors=True),
         ]
+        wrapper_class = structlog.stdlib.BoundLogger
+        logger_factory = structlog.stdlib.LoggerFactory()
     
     # Configure structlog
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=wrapper_class,
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
+    _active_config = config_key
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> Any:
     """
     Get a structured logger instance.
+
+    Loggers are memoized per name; they hold no per-caller state.
     
     Args:
         name: Logger name (typically __name__)
@@ -142,4 +235,3 @@ def get_logger(name: str) -> Any:
         Structured logger instance
     """
     return structlog.get_logger(name)
-
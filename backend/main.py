@@ -6,26 +6,35 @@ including middleware, routes, and lifecycle events.
 """
 
 import asyncio
+import hashlib
+import mimetypes
+import os
+import shutil
+import sys
 import threading
 import time
-from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
 
 from pathlib import Path
 
 from fastapi import FastAPI, APIRouter, Request, HTTPException, Query, Depends, WebSocket, WebSocketDisconnect
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
+import orjson
+import psutil
 from sqlalchemy.orm import Session
 
 from backend.api import cleanup_router, jobs_router, metrics_router, placeholder_router, reports_router, upload_router, visualizations_router
+from backend.api.visualizations import shutdown_overlay_pool
 from backend.core import get_settings, init_db, setup_logging
-from backend.core.logging import get_logger
-from backend.core.database import get_db
-
-# Clear any cached settings and initialize fresh
-from backend.core.config import get_settings
-get_settings.cache_clear()  # Clear LRU cache
+from backend.core.cors import FastCORSMiddleware
+from backend.core.logging import flush_logs, get_logger
+from backend.core.database import SessionLocal, get_db
+from backend.models.job import JobStatus
+from backend.services.job_service import JobService
 
 # Initialize settings (will be reloaded at runtime for environment variables)
 settings = get_settings()
@@ -33,6 +42,53 @@ setup_logging(settings.log_level, settings.environment)
 logger = get_logger(__name__)
 
 
+class SettingsSnapshot(NamedTuple):
+    """Immutable copy of the settings values read by request handlers."""
+
+    app_name: str
+    app_version: str
+    environment: str
+    max_concurrent_jobs: int
+    max_upload_size_mb: float
+    cors_origins: Tuple[str, ...]
+    health_body: bytes  # Pre-encoded /health payload
+
+
+def _snapshot_settings(current_settings) -> SettingsSnapshot:
+    """Freeze the handler-facing settings values."""
+    return SettingsSnapshot(
+        app_name=current_settings.app_name,
+        app_version=current_settings.app_version,
+        environment=current_settings.environment,
+        max_concurrent_jobs=current_settings.max_concurrent_jobs,
+        max_upload_size_mb=round(current_settings.max_upload_size / (1024**2), 0),
+        cors_origins=tuple(current_settings.cors_origins_list),
+        health_body=orjson.dumps({
+            "status": "healthy",
+            "app_name": current_settings.app_name,
+            "version": current_settings.app_version,
+            "environment": current_settings.environment,
+        }),
+    )
+
+
+# Rebound (never mutated) when settings are reloaded in lifespan
+SETTINGS = _snapshot_settings(settings)
+
+
+# Maximum number of stale temp directories removed concurrently at startup
+TEMP_CLEANUP_WORKERS = 8
+
+
+def _remove_temp_directory(temp_dir: Path) -> None:
+    """Remove a stale temp directory, logging (not raising) on failure."""
+    try:
+        shutil.rmtree(temp_dir)
+        logger.info("cleanup_temp_directory", path=str(temp_dir))
+    except Exception as e:
+        logger.warning("temp_directory_cleanup_failed", path=str(temp_dir), error=str(e))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -40,12 +96,14 @@ async def lifespan(app: FastAPI):
 
     Handles startup and shutdown events.
     """
-    global settings, logger
+    global settings, logger, SETTINGS
 
     # Reload settings at runtime (environment variables should now be set)
+    get_settings.cache_clear()
     settings = get_settings()
     setup_logging(settings.log_level, settings.environment)
     logger = get_logger(__name__)
+    SETTINGS = _snapshot_settings(settings)
 
     # Startup
     logger.info(
@@ -68,25 +126,25 @@ async def lifespan(app: FastAPI):
 
     # Clean up temporary files from previous runs
     try:
-        import shutil
-        import os
-        from pathlib import Path
-
         # Clean up temp directories older than 1 hour
         temp_base = Path(settings.data_dir) / "temp"
         if temp_base.exists():
-            import time
             current_time = time.time()
-            for temp_dir in temp_base.iterdir():
-                if temp_dir.is_dir():
+            stale_dirs = []
+            # scandir entries carry the file type, so only the mtime needs a stat
+            with os.scandir(temp_base) as entries:
+                for entry in entries:
                     try:
                         # Check if directory is older than 1 hour
-                        dir_mtime = temp_dir.stat().st_mtime
-                        if current_time - dir_mtime > 3600:  # 1 hour
-                            shutil.rmtree(temp_dir)
-                            logger.info("cleanup_temp_directory", path=str(temp_dir))
+                        if entry.is_dir(follow_symlinks=False) and current_time - entry.stat(follow_symlinks=False).st_mtime > 3600:  # 1 hour
+                            stale_dirs.append(Path(entry.path))
                     except Exception as e:
-                        logger.warning("temp_directory_cleanup_failed", path=str(temp_dir), error=str(e))
+                        logger.warning("temp_directory_cleanup_failed", path=entry.path, error=str(e))
+
+            # rmtree is I/O bound - remove stale directories concurrently
+            if stale_dirs:
+                with ThreadPoolExecutor(max_workers=TEMP_CLEANUP_WORKERS) as pool:
+                    list(pool.map(_remove_temp_directory, stale_dirs))
 
         logger.info("temp_file_cleanup_completed")
     except Exception as e:
@@ -94,19 +152,14 @@ async def lifespan(app: FastAPI):
         # Don't raise - let the app start even if DB init fails
 
 
-    # Special route for working version
-    @app.get("/working")
-    async def working_page():
-        frontend_dir = Path(__file__).parent.parent / "frontend"
-        working_file = frontend_dir / "index.html"
-        if working_file.exists():
-            return FileResponse(str(working_file), media_type="text/html")
-        return JSONResponse({"error": "Working file not found"}, status_code=404)
+    # Cache the HTML entry pages in memory so requests never touch the disk
+    app.state.index_html, app.state.index_etag = _read_html_with_etag(FRONTEND_INDEX_FILE)
+    app.state.working_html, app.state.working_etag = _read_html_with_etag(FRONTEND_DIR / "index.html")
 
     # Static files are now handled by custom route with caching headers
-    static_dir = Path(__file__).parent.parent / "static"
-    if static_dir.exists():
-        logger.info("static_files_enabled_with_caching", path=str(static_dir))
+    if STATIC_DIR.exists():
+        STATIC_CACHE.update(_load_static_cache(STATIC_DIR))
+        logger.info("static_files_enabled_with_caching", path=str(STATIC_DIR), cached_files=len(STATIC_CACHE))
 
     # Mount static files for web frontend from dist directory
     frontend_dir = Path(__file__).parent.parent / "frontend" / "dist"
@@ -114,7 +167,7 @@ async def lifespan(app: FastAPI):
         index_file = frontend_dir / "index.html"
         if index_file.exists():
             logger.info("serving_index_html_from", path=str(index_file))
-        app.mount("/", StaticFiles(directory=str(frontend_dir), html=True), name="frontend")
+        app.mount("/", RevalidatingStaticFiles(directory=str(frontend_dir), html=True), name="frontend")
         logger.info("frontend_static_files_enabled", path=str(frontend_dir))
     else:
         logger.warning("frontend_directory_not_found", path=str(frontend_dir))
@@ -123,6 +176,8 @@ async def lifespan(app: FastAPI):
 
 
     logger.info("application_shutting_down")
+    shutdown_overlay_pool()
+    flush_logs()
 
 
 # Create FastAPI application
@@ -133,6 +188,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Automatic job processing is handled by the trigger_queue.py script
@@ -167,66 +223,136 @@ def delete_job(
     Raises:
         HTTPException: If job not found
     """
-    from backend.services.job_service import JobService
     deleted = JobService.delete_job(db, job_id)
 
     if not deleted:
         raise HTTPException(status_code=404, detail="Job not found")
 
-# Configure CORS
-# If cors_origins_list contains "*", use allow_origin_regex to match all origins
-cors_origins = settings.cors_origins_list
-if cors_origins == ["*"]:
-    # Allow all origins when "*" is specified
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origin_regex=r".*",  # Match any origin
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
-else:
-    # Use specific origins
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=cors_origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+# Configure CORS ("*" accepts all origins; the origin is echoed since credentials are allowed)
+app.add_middleware(FastCORSMiddleware, origins=SETTINGS.cors_origins, allow_credentials=True)
+
+# Frontend entry pages, read into app.state at startup
+FRONTEND_DIR = Path(__file__).parent.parent / "frontend"
+FRONTEND_INDEX_FILE = FRONTEND_DIR / "dist" / "index.html"
+
+
+def _read_html_with_etag(path: Path) -> Tuple[Optional[bytes], Optional[str]]:
+    """
+    Read an HTML file and compute its ETag.
+
+    Returns:
+        (content, ETag), or (None, None) if the file does not exist
+    """
+    if not path.is_file():
+        return None, None
+    content = path.read_bytes()
+    return content, f'"{hashlib.md5(content).hexdigest()}"'
+
+
+def _cached_html_response(request: Request, content: bytes, etag: str, cache_control: Optional[str] = None) -> Response:
+    """Build an HTML response from cached bytes, answering 304 if the client's copy is current."""
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=content, headers=headers)
+
 
 # Custom static file handler with caching headers
-from starlette.responses import FileResponse
+STATIC_DIR = Path(__file__).parent.parent / "static"
+
+# Small static assets preloaded at startup:
+# relative path -> (content, media type, ETag, (st_mtime_ns, st_size))
+STATIC_CACHE: Dict[str, Tuple[bytes, str, str, Tuple[int, int]]] = {}
+
+# Larger static files are not preloaded; FileResponse streams them from disk
+STATIC_CACHE_MAX_FILE_SIZE = 256 * 1024
+
+# Frontend build assets may change on redeploy; StaticFiles already answers
+# If-None-Match with 304, so let browsers cache briefly and then revalidate.
+FRONTEND_CACHE_CONTROL = "public, max-age=3600, must-revalidate"
+
+
+class RevalidatingStaticFiles(StaticFiles):
+    """StaticFiles that adds a Cache-Control header to its ETag-bearing responses."""
+
+    async def get_response(self, path: str, scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers.setdefault("Cache-Control", FRONTEND_CACHE_CONTROL)
+        return response
+
+
+STATIC_CACHE_HEADERS = {
+    "Cache-Control": "public, max-age=31536000, immutable",
+    "Expires": "Thu, 31 Dec 2037 23:59:59 GMT",
+}
+
+
+def _static_file_version(file_path: Path) -> Optional[Tuple[int, int]]:
+    """Identify the current contents of a static file by (st_mtime_ns, st_size), or None if it is gone."""
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_static_cache(static_dir: Path) -> Dict[str, Tuple[bytes, str, str, Tuple[int, int]]]:
+    """
+    Read the small files under static_dir into memory with their media type and ETag.
+
+    Files larger than STATIC_CACHE_MAX_FILE_SIZE are left on disk.
+
+    Args:
+        static_dir: Directory containing the bundled static assets
+
+    Returns:
+        Mapping of POSIX-style relative path to (content, media type, ETag, file version)
+    """
+    cache = {}
+    for file_path in static_dir.rglob("*"):
+        if not file_path.is_file():
+            continue
+        version = _static_file_version(file_path)
+        if version is None or version[1] > STATIC_CACHE_MAX_FILE_SIZE:
+            continue
+        content = file_path.read_bytes()
+        media_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
+        etag = f'"{hashlib.md5(content).hexdigest()}"'
+        cache[file_path.relative_to(static_dir).as_posix()] = (content, media_type, etag, version)
+    return cache
+
 
 @app.api_route("/static/{path:path}", methods=["GET", "HEAD"])
-async def serve_static_with_cache(path: str):
+async def serve_static_with_cache(path: str, request: Request):
     """Serve static files with appropriate caching headers."""
+    cached = STATIC_CACHE.get(path)
+    if cached is not None:
+        content, media_type, etag, version = cached
+        if _static_file_version(STATIC_DIR / path) == version:
+            headers = {**STATIC_CACHE_HEADERS, "ETag": etag}
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers=headers)
+            return Response(content=content, media_type=media_type, headers=headers)
+        # Changed or removed since startup - stop serving the stale copy
+        STATIC_CACHE.pop(path, None)
+
+    # Not preloaded (large, changed or added after startup) - serve from disk
     logger.info("serving_static_file_with_cache", path=path)
-    static_dir = Path(__file__).parent.parent / "static"
-    file_path = static_dir / path
+    file_path = STATIC_DIR / path
 
     if not file_path.exists() or not file_path.is_file():
         logger.error("static_file_not_found", path=str(file_path))
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="File not found")
 
     # Static assets: cache for 1 year
     response = FileResponse(str(file_path))
-    response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
-    response.headers["Expires"] = "Thu, 31 Dec 2037 23:59:59 GMT"
+    response.headers.update(STATIC_CACHE_HEADERS)
     logger.info("static_file_served_with_cache", path=path, cache_control=response.headers.get("Cache-Control"))
     return response
 
-# Add caching headers for HTML responses
-@app.middleware("http")
-async def add_html_cache_headers(request, call_next):
-    response = await call_next(request)
-    if request.url.path == "/" and hasattr(response, 'headers'):
-        # HTML: cache for 1 hour to allow updates
-        response.headers["Cache-Control"] = "public, max-age=3600"
-    return response
-
-
 # Health check endpoint - supports both GET and HEAD methods for wait-on compatibility
 @app.api_route("/health", methods=["GET", "HEAD"], tags=["health"])
 async def health_check():
@@ -235,50 +361,66 @@ async def health_check():
 
     Returns application status and version information.
     Supports both GET and HEAD methods for compatibility with health check libraries.
+    The body is encoded once per settings load (see _snapshot_settings).
     """
-    current_settings = get_settings()
-    return {
-        "status": "healthy",
-        "app_name": current_settings.app_name,
-        "version": current_settings.app_version,
-        "environment": current_settings.environment,
-    }
+    return Response(content=SETTINGS.health_body, media_type="application/json", headers={"Cache-Control": "no-store"})
 
 
 # Root endpoint - serves the React frontend
 @app.get("/", tags=["root"])
-async def root():
+async def root(request: Request):
     """
     Root endpoint - serves the React frontend for web deployment.
+
+    index.html is read once at startup (see lifespan) and served from memory.
     """
-    # Serve the React frontend directly
-    from pathlib import Path
-    frontend_path = Path(__file__).parent.parent / "frontend" / "dist" / "index.html"
-    if frontend_path.exists():
-        with open(frontend_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        from fastapi.responses import HTMLResponse
-        return HTMLResponse(
-            content=content,
-            status_code=200,
-            headers={
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Expires": "0"
-            }
+    index_html = getattr(request.app.state, "index_html", None)
+    if index_html is not None:
+        return _cached_html_response(
+            request,
+            index_html,
+            request.app.state.index_etag,
+            # HTML: cache for 1 hour to allow updates
+            cache_control="public, max-age=3600",
         )
     else:
-        return {"error": "Frontend not found", "path": str(frontend_path)}
+        return {"error": "Frontend not found", "path": str(FRONTEND_INDEX_FILE)}
+
+
+# Special route for working version
+@app.get("/working")
+async def working_page(request: Request):
+    """Serve the working (unbuilt) frontend page, read once at startup (see lifespan)."""
+    working_html = getattr(request.app.state, "working_html", None)
+    if working_html is not None:
+        return _cached_html_response(
+            request,
+            working_html,
+            request.app.state.working_etag,
+            # Always revalidate; unchanged pages are answered with 304
+            cache_control="no-cache",
+        )
+    return ORJSONResponse({"error": "Working file not found"}, status_code=404)
 
 
 # Exception handlers
+# Raised when the client goes away mid-request; not an application error
+CLIENT_DISCONNECT_ERRORS = (ConnectionResetError, BrokenPipeError)
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """
     Global exception handler.
     
     Catches unhandled exceptions and returns a standardized error response.
+    Client disconnects are logged without a traceback, as there is no one
+    left to receive the response.
     """
+    if isinstance(exc, CLIENT_DISCONNECT_ERRORS):
+        logger.info("client_disconnected", path=request.url.path, error_type=type(exc).__name__)
+        return Response(status_code=499)
+
     logger.error(
         "unhandled_exception",
         path=request.url.path,
@@ -287,11 +429,11 @@ async def global_exception_handler(request, exc):
         exc_info=True,
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
-            "error": str(exc) if settings.environment == "development" else None,
+            "error": str(exc) if SETTINGS.environment == "development" else None,
         },
     )
 
@@ -306,34 +448,46 @@ app.include_router(visualizations_router, prefix="/api")
 app.include_router(cleanup_router, prefix="/api")  # Admin cleanup endpoints
 
 # System status endpoint
+@lru_cache(maxsize=1)
+def _system_metrics(time_bucket: int) -> dict:
+    """
+    Collect host and process metrics, memoized per wall-clock second.
+
+    Args:
+        time_bucket: Current time in whole seconds; a new value refreshes the cache
+    """
+    memory = psutil.virtual_memory()
+    disk = psutil.disk_usage('/')
+
+    # Process information
+    process_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
+
+    return {
+        "memory_usage_percent": round(memory.percent, 1),
+        "memory_used_gb": round(memory.used / (1024**3), 1),
+        "memory_total_gb": round(memory.total / (1024**3), 1),
+        "disk_usage_percent": round(disk.percent, 1),
+        "disk_free_gb": round(disk.free / (1024**3), 1),
+        "process_memory_mb": round(process_memory, 1)
+    }
+
+
 @app.get("/api/status", response_model=dict)
-async def get_system_status(db: Session = Depends(get_db)):
+def get_system_status():
     """
     Get comprehensive system status information.
 
     Includes service health, job statistics, and system metrics.
     This is the main status endpoint for monitoring the application.
+    The session is opened only around the single count query.
     """
-    from backend.services import JobService
-    from backend.models.job import JobStatus
-    import psutil
-    import time
-
     try:
         # Job statistics
-        total_jobs = JobService.count_jobs_by_status(db, [JobStatus.PENDING, JobStatus.RUNNING, JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED])
-        completed_jobs = JobService.count_jobs_by_status(db, [JobStatus.COMPLETED])
-        running_jobs = JobService.count_jobs_by_status(db, [JobStatus.RUNNING])
-        pending_jobs = JobService.count_jobs_by_status(db, [JobStatus.PENDING])
-        failed_jobs = JobService.count_jobs_by_status(db, [JobStatus.FAILED])
+        with SessionLocal() as db:
+            job_counts = JobService.count_jobs_grouped(db)
 
         # System metrics
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-
-        # Process information
-        current_process = psutil.Process()
-        process_memory = current_process.memory_info().rss / 1024 / 1024  # MB
+        system_metrics = _system_metrics(int(time.time()))
 
         # Check service health
         services = {
@@ -345,26 +499,19 @@ async def get_system_status(db: Session = Depends(get_db)):
         return {
             "status": "healthy",
             "timestamp": time.time(),
-            "version": settings.app_version,
+            "version": SETTINGS.app_version,
             "services": services,
             "jobs": {
-                "total": total_jobs,
-                "completed": completed_jobs,
-                "running": running_jobs,
-                "pending": pending_jobs,
-                "failed": failed_jobs
-            },
-            "system": {
-                "memory_usage_percent": round(memory.percent, 1),
-                "memory_used_gb": round(memory.used / (1024**3), 1),
-                "memory_total_gb": round(memory.total / (1024**3), 1),
-                "disk_usage_percent": round(disk.percent, 1),
-                "disk_free_gb": round(disk.free / (1024**3), 1),
-                "process_memory_mb": round(process_memory, 1)
+                "total": sum(job_counts.values()),
+                "completed": job_counts[JobStatus.COMPLETED],
+                "running": job_counts[JobStatus.RUNNING],
+                "pending": job_counts[JobStatus.PENDING],
+                "failed": job_counts[JobStatus.FAILED]
             },
+            "system": system_metrics,
             "limits": {
-                "max_concurrent_jobs": settings.max_concurrent_jobs,
-                "max_upload_size_mb": round(settings.max_upload_size / (1024**2), 0)
+                "max_concurrent_jobs": SETTINGS.max_concurrent_jobs,
+                "max_upload_size_mb": SETTINGS.max_upload_size_mb
             }
         }
 
@@ -378,23 +525,64 @@ async def get_system_status(db: Session = Depends(get_db)):
 
 
 # WebSocket endpoint for real-time job updates
+WS_MAX_BATCH_SIZE = 64  # Upper bound on messages per frame
+WS_OUTBOX_SIZE = 256  # Per-connection queue bound; a client that lets it fill is disconnected
+WS_CLOSE_OUTBOX_FULL = 1008  # Policy violation: the client stopped reading its frames
+
+
+async def _ws_receive_loop(websocket: WebSocket, outbox: asyncio.Queue) -> None:
+    """Queue an acknowledgement for every text message received from the client."""
+    while True:
+        data = await websocket.receive_text()
+        try:
+            outbox.put_nowait(f"Message received: {data}")
+        except asyncio.QueueFull:
+            # Never block on a client that is not draining its frames; drop it instead
+            logger.warning("websocket_outbox_full", outbox_size=WS_OUTBOX_SIZE)
+            await websocket.close(code=WS_CLOSE_OUTBOX_FULL)
+            return
+
+
+async def _ws_send_loop(websocket: WebSocket, outbox: asyncio.Queue) -> None:
+    """Send queued messages to the client, everything already queued as one JSON array."""
+    while True:
+        batch = [await outbox.get()]
+        # No waiting for more: a lone message goes out at once, a backlog in one frame
+        while len(batch) < WS_MAX_BATCH_SIZE and not outbox.empty():
+            batch.append(outbox.get_nowait())
+        # Text frame: browsers hand binary frames to onmessage as a Blob, not a string
+        await websocket.send_text(orjson.dumps(batch).decode())
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
+    """
+    WebSocket for real-time updates.
+
+    Outgoing messages go through a bounded per-connection queue drained by a
+    single sender task. Each frame is an orjson-encoded array of the messages
+    queued at that moment (at most WS_MAX_BATCH_SIZE), e.g.
+    ["Message received: hello"].
+    """
     await websocket.accept()
+    outbox: asyncio.Queue = asyncio.Queue(maxsize=WS_OUTBOX_SIZE)
+    receiver = asyncio.create_task(_ws_receive_loop(websocket, outbox))
+    sender = asyncio.create_task(_ws_send_loop(websocket, outbox))
     try:
-        while True:
-            # Send periodic job status updates
-            data = await websocket.receive_text()
-            await websocket.send_text(f"Message received: {data}")
-    except WebSocketDisconnect:
-        pass
+        # Either loop ending (client disconnect, failed send, full outbox) ends the connection
+        await asyncio.wait({receiver, sender}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in (receiver, sender):
+            task.cancel()
+        for task in (receiver, sender):
+            with suppress(asyncio.CancelledError, WebSocketDisconnect, Exception):
+                await task
 
 # Static file mounting will be done in lifespan after settings are initialized
 
 
 if __name__ == "__main__":
     import uvicorn
-    import os
 
     port = int(os.getenv("PORT", settings.api_port))
     should_reload = settings.environment == "development"
@@ -412,5 +600,10 @@ if __name__ == "__main__":
         port=port,
         reload=should_reload,
         log_level=settings.log_level.lower(),
+        # C event loop and HTTP parser (both installed by uvicorn[standard]); uvloop is POSIX-only
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # Multiple workers cannot be combined with reload
+        workers=None if should_reload else int(os.getenv("WEB_CONCURRENCY", "1")),
     )
 
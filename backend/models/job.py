@@ -5,11 +5,11 @@ This model stores information about uploaded MRI scans and their
 processing status throughout the pipeline.
 """
 
-import uuid
+import secrets
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, DateTime, Enum, Integer, String, Text
+from sqlalchemy import Column, DateTime, Enum, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from backend.core.database import Base
@@ -25,6 +25,11 @@ class JobStatus(PyEnum):
     CANCELLED = "cancelled"
 
 
+# Status groups, built once so status checks are a single set lookup
+TERMINAL_STATUSES = frozenset((JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED))
+ACTIVE_STATUSES = frozenset((JobStatus.PENDING, JobStatus.RUNNING))
+
+
 class Job(Base):
     """
     Job model representing an MRI processing task.
@@ -43,12 +48,16 @@ class Job(Base):
     """
     
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Matches the (created_at DESC, id DESC) ordering used for keyset pagination
+        Index("ix_jobs_created_at_id", "created_at", "id"),
+    )
     
     # Primary key - String(8) for shorter job IDs
     id = Column(
         String(8),
         primary_key=True,
-        default=lambda: str(uuid.uuid4())[:8],
+        default=lambda: secrets.token_hex(4),
         index=True,
         doc="Unique job identifier (8 characters)"
     )
@@ -188,12 +197,12 @@ class Job(Base):
     @property
     def is_complete(self) -> bool:
         """Check if job has completed processing."""
-        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+        return self.status in TERMINAL_STATUSES
     
     @property
     def is_active(self) -> bool:
         """Check if job is currently processing or waiting to start."""
-        return self.status in (JobStatus.PENDING, JobStatus.RUNNING)
+        return self.status in ACTIVE_STATUSES
     
     @property
     def duration_seconds(self) -> float:
@@ -13,6 +13,22 @@ from sqlalchemy.orm import relationship
 
 from backend.core.database import Base
 
+# HS thresholds from dashboard
+LEFT_HS_THRESHOLD = -0.070839747728063
+RIGHT_HS_THRESHOLD = 0.046915816971433
+
+# Threshold information appended to every laterality label as bullet points
+_THRESHOLDS_INFO = f"""Thresholds:
+
+• Left HS (Right-dominant) if AI < {LEFT_HS_THRESHOLD:.12f}
+• Right HS (Left-dominant) if AI > {RIGHT_HS_THRESHOLD:.12f}
+• No HS (Balanced) otherwise."""
+
+# Full laterality strings, built once instead of per property access
+_LATERALITY_RIGHT_HS = f"Left-dominant (Right HS suspected)\n\n{_THRESHOLDS_INFO}"
+_LATERALITY_LEFT_HS = f"Right-dominant (Left HS suspected)\n\n{_THRESHOLDS_INFO}"
+_LATERALITY_BALANCED = f"Balanced (No HS)\n\n{_THRESHOLDS_INFO}"
+
 
 class Metric(Base):
     """
@@ -105,23 +121,9 @@ class Metric(Base):
     @property
     def laterality(self) -> str:
         """Determine laterality based on hippocampal sclerosis thresholds."""
-        # HS thresholds from dashboard
-        LEFT_HS_THRESHOLD = -0.070839747728063
-        RIGHT_HS_THRESHOLD = 0.046915816971433
-
         if self.asymmetry_index > RIGHT_HS_THRESHOLD:
-            classification = "Left-dominant (Right HS suspected)"
+            return _LATERALITY_RIGHT_HS
         elif self.asymmetry_index < LEFT_HS_THRESHOLD:
-            classification = "Right-dominant (Left HS suspected)"
-        else:
-            classification = "Balanced (No HS)"
-
-        # Add threshold information as bullet points
-        thresholds_info = f"""Thresholds:
-
-• Left HS (Right-dominant) if AI < {LEFT_HS_THRESHOLD:.12f}
-• Right HS (Left-dominant) if AI > {RIGHT_HS_THRESHOLD:.12f}
-• No HS (Balanced) otherwise."""
-
-        return f"{classification}\n\n{thresholds_info}"
+            return _LATERALITY_LEFT_HS
+        return _LATERALITY_BALANCED
 
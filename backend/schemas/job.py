@@ -8,7 +8,7 @@ job-related API requests and responses.
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator, field_serializer
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class JobStatus(str, Enum):
@@ -138,9 +138,7 @@ class MetricSummary(BaseModel):
     asymmetry_index: float
     laterality: str
     
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class JobResponse(BaseModel):
@@ -156,19 +154,6 @@ class JobResponse(BaseModel):
         min_length=8,
         max_length=8
     )
-
-    @field_validator('id', mode='before')
-    @classmethod
-    def validate_id(cls, v):
-        """Convert UUID objects to string."""
-        if hasattr(v, '__str__'):
-            return str(v)
-        return v
-
-    @field_serializer('id')
-    def serialize_id(self, value):
-        """Ensure ID is returned as string."""
-        return str(value)
     
     filename: str = Field(
         ...,
@@ -268,7 +253,5 @@ class JobResponse(BaseModel):
         description="Associated hippocampal metrics"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import Optional
 # from uuid import UUID  # Not needed for string job IDs
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 
 
 class MetricCreate(BaseModel):
@@ -111,7 +111,5 @@ class MetricResponse(BaseModel):
         description="Metric creation timestamp"
     )
     
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
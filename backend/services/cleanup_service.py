@@ -8,10 +8,18 @@ This service provides long-term storage management:
 - Storage quota management
 """
 
+import os
+import re
+import shutil
+import stat
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
-from uuid import UUID
+from typing import Callable, List, Optional, Set, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -25,6 +33,128 @@ from backend.services.storage_service import StorageService
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Jobs deleted per transaction by the retention cleanups
+CLEANUP_BATCH_SIZE = 500
+
+# Candidate job ids looked up per IN (...) query by the orphan scan
+ORPHAN_ID_QUERY_CHUNK = 1000
+
+
+@lru_cache(maxsize=1)
+def _get_file_io_pool() -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool used to delete and measure files and directories.
+
+    unlink/rmtree/stat are I/O bound and release the GIL, so working on
+    many jobs' files concurrently overlaps the filesystem latency.
+    """
+    return ThreadPoolExecutor(
+        max_workers=min(32, (os.cpu_count() or 1) * 4),
+        thread_name_prefix="cleanup-io",
+    )
+
+
+# Job-keyed names in the orphan scan: "<uuid>_<filename>" uploads and "<uuid>" output dirs
+_UUID_PATTERN = r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+_UUID_PREFIX_RE = re.compile(rf"({_UUID_PATTERN})_", re.IGNORECASE)
+_UUID_RE = re.compile(_UUID_PATTERN, re.IGNORECASE)
+
+# rm(1) removes a tree without a Python call per entry; used where available
+_RM_BINARY = shutil.which("rm") if sys.platform != "win32" else None
+
+
+def _remove_tree(path: Path) -> None:
+    """
+    Remove a directory tree.
+
+    Job output directories hold thousands of FreeSurfer files, so the removal
+    is delegated to ``rm -rf`` (one fork/exec for the whole tree) instead of
+    shutil.rmtree's per-entry Python calls. Falls back to shutil.rmtree
+    when rm is unavailable.
+
+    Raises:
+        FileNotFoundError: If path does not exist
+        OSError: If the tree could not be removed
+    """
+    if _RM_BINARY is None:
+        shutil.rmtree(path)
+        return
+
+    # rm -rf is silent about missing paths; keep rmtree's contract for callers
+    if not stat.S_ISDIR(os.lstat(path).st_mode):
+        raise NotADirectoryError(f"Not a directory: {path}")
+
+    result = subprocess.run(
+        [_RM_BINARY, "-rf", "--", str(path)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise OSError(f"rm -rf {path} failed: {result.stderr.strip()}")
+
+
+# find(1) lists file sizes for a whole tree in a single subprocess
+_FIND_BINARY = shutil.which("find") if sys.platform != "win32" else None
+
+# Longest the find-based size scan may run before falling back to the Python walk
+STORAGE_SCAN_TIMEOUT_SECONDS = 30
+
+
+def _find_job_files_size(outputs_dir: Path) -> Optional[int]:
+    """
+    Total size in bytes of the regular files inside job directories under outputs_dir.
+
+    Runs ``find -mindepth 2 -type f -printf '%s\\n'``, so the walk happens in
+    C in a single subprocess. Like _directory_size it counts only regular
+    files below the job directories: directory entries, symlinks and files
+    directly in outputs_dir are excluded. Returns None when find is
+    unavailable, fails (e.g. BSD/macOS find has no -printf) or exceeds
+    STORAGE_SCAN_TIMEOUT_SECONDS, so callers can fall back to the Python walk.
+    """
+    if _FIND_BINARY is None:
+        return None
+    try:
+        output = subprocess.run(
+            [_FIND_BINARY, str(outputs_dir), "-mindepth", "2", "-type", "f", "-printf", "%s\\n"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=STORAGE_SCAN_TIMEOUT_SECONDS,
+            check=True,
+        ).stdout
+        return sum(map(int, output.split()))
+    except subprocess.TimeoutExpired:
+        logger.warning("storage_scan_timed_out", path=str(outputs_dir), timeout=STORAGE_SCAN_TIMEOUT_SECONDS)
+        return None
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None
+
+
+def _directory_size(path: str) -> int:
+    """
+    Total size in bytes of the regular files under a directory.
+
+    Walks the tree with os.scandir on plain strings. Entry types come from
+    the directory listing, so only regular files are stat'ed.
+    Symlinks are neither followed nor counted.
+    """
+    total = 0
+    pending = [path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
 
 class CleanupService:
     """
@@ -42,7 +172,7 @@ class CleanupService:
         Delete all files associated with a job.
         
         Args:
-            job: Job instance
+            job: Job instance (or a row with id and file_path)
             
         Returns:
             Tuple of (upload_files_deleted, output_files_deleted)
@@ -59,24 +189,101 @@ class CleanupService:
             except Exception as e:
                 logger.warning("job_upload_file_delete_failed", job_id=str(job.id), error=str(e))
         
-        # Delete output directory
+        # Delete output directory (no separate existence check; removal fails fast if absent)
         output_dir = self.outputs_dir / str(job.id)
-        if output_dir.exists():
-            try:
-                import shutil
-                shutil.rmtree(output_dir)
-                output_files_deleted = 1
-                logger.info("job_output_directory_deleted", job_id=str(job.id), path=str(output_dir))
-            except Exception as e:
-                logger.warning("job_output_directory_delete_failed", job_id=str(job.id), error=str(e))
+        try:
+            _remove_tree(output_dir)
+            output_files_deleted = 1
+            logger.info("job_output_directory_deleted", job_id=str(job.id), path=str(output_dir))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("job_output_directory_delete_failed", job_id=str(job.id), error=str(e))
         
         return (upload_files_deleted, output_files_deleted)
     
+    def _purge_jobs(
+        self,
+        db: Session,
+        criteria: tuple,
+        batch_size: int,
+        dry_run: bool,
+        log_job: Callable,
+        inter_batch_delay_seconds: float = 0.0,
+    ) -> Tuple[int, int, int]:
+        """
+        Delete jobs matching criteria, with their metrics and files, in batches.
+
+        Only the columns needed for cleanup are loaded. Each batch is removed
+        with two set-oriented DELETE statements and committed on its own, so
+        large backlogs never hold every row in memory or in one transaction.
+
+        Args:
+            db: Database session
+            criteria: SQLAlchemy filter expressions selecting the jobs
+            batch_size: Number of jobs deleted per transaction
+            dry_run: If True, only report what would be deleted
+            log_job: Called with each selected row before it is deleted
+            inter_batch_delay_seconds: Pause between committed batches to
+                limit load on a shared database
+
+        Returns:
+            Tuple of (jobs_deleted, upload_files_deleted, output_dirs_deleted)
+        """
+        jobs_deleted = 0
+        upload_files_deleted = 0
+        output_dirs_deleted = 0
+
+        # Keyset pagination on the primary key: stable whether or not rows are deleted
+        last_id = ""
+        while True:
+            rows = (
+                db.query(Job.id, Job.file_path, Job.completed_at, Job.error_message)
+                .filter(*criteria, Job.id > last_id)
+                .order_by(Job.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            for row in rows:
+                log_job(row)
+
+            if dry_run:
+                continue
+
+            job_ids = [row.id for row in rows]
+            db.query(Metric).filter(Metric.job_id.in_(job_ids)).delete(synchronize_session=False)
+            jobs_deleted += db.query(Job).filter(Job.id.in_(job_ids)).delete(synchronize_session=False)
+            db.commit()
+
+            # Files go after the commit; anything left behind is picked up as orphaned
+            for upload_del, output_del in _get_file_io_pool().map(self.delete_job_files, rows):
+                upload_files_deleted += upload_del
+                output_dirs_deleted += output_del
+
+            # Each batch is durable on its own; a rerun after a crash resumes with what is left
+            logger.info(
+                "job_cleanup_batch_committed",
+                batch_jobs=len(rows),
+                jobs_deleted=jobs_deleted,
+                last_job_id=str(last_id),
+            )
+
+            if inter_batch_delay_seconds > 0 and len(rows) == batch_size:
+                time.sleep(inter_batch_delay_seconds)
+
+        return (jobs_deleted, upload_files_deleted, output_dirs_deleted)
+
     def cleanup_old_completed_jobs(
         self,
         db: Session,
         days_old: int = 30,
-        dry_run: bool = False
+        dry_run: bool = False,
+        batch_size: int = CLEANUP_BATCH_SIZE,
+        inter_batch_delay_seconds: float = 0.0,
     ) -> Tuple[int, int, int]:
         """
         Clean up old completed jobs based on retention policy.
@@ -85,53 +292,40 @@ class CleanupService:
             db: Database session
             days_old: Number of days after completion to retain jobs
             dry_run: If True, only report what would be deleted
+            batch_size: Number of jobs deleted per transaction
+            inter_batch_delay_seconds: Pause between committed batches
             
         Returns:
             Tuple of (jobs_deleted, upload_files_deleted, output_dirs_deleted)
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=days_old)
-        
-        old_jobs = db.query(Job).filter(
-            Job.status == JobStatus.COMPLETED,
-            Job.completed_at < cutoff_date
-        ).all()
-        
-        jobs_deleted = 0
-        upload_files_deleted = 0
-        output_dirs_deleted = 0
-        
-        for job in old_jobs:
+        now = datetime.utcnow()
+        cutoff_date = now - timedelta(days=days_old)
+
+        def log_job(job) -> None:
             logger.info(
                 "old_job_cleanup",
                 job_id=str(job.id),
                 completed_at=job.completed_at.isoformat(),
-                days_old=(datetime.utcnow() - job.completed_at).days,
+                days_old=(now - job.completed_at).days,
                 dry_run=dry_run
             )
-            
-            if not dry_run:
-                # Delete associated metrics
-                db.query(Metric).filter(Metric.job_id == job.id).delete()
-                
-                # Delete files
-                upload_del, output_del = self.delete_job_files(job)
-                upload_files_deleted += upload_del
-                output_dirs_deleted += output_del
-                
-                # Delete job record
-                db.delete(job)
-                jobs_deleted += 1
-        
-        if not dry_run:
-            db.commit()
-        
-        return (jobs_deleted, upload_files_deleted, output_dirs_deleted)
+
+        return self._purge_jobs(
+            db,
+            (Job.status == JobStatus.COMPLETED, Job.completed_at < cutoff_date),
+            batch_size,
+            dry_run,
+            log_job,
+            inter_batch_delay_seconds,
+        )
     
     def cleanup_failed_jobs(
         self,
         db: Session,
         days_old: int = 7,
-        dry_run: bool = False
+        dry_run: bool = False,
+        batch_size: int = CLEANUP_BATCH_SIZE,
+        inter_batch_delay_seconds: float = 0.0,
     ) -> Tuple[int, int, int]:
         """
         Clean up old failed jobs (shorter retention than completed).
@@ -140,22 +334,15 @@ class CleanupService:
             db: Database session
             days_old: Number of days after failure to retain jobs
             dry_run: If True, only report what would be deleted
+            batch_size: Number of jobs deleted per transaction
+            inter_batch_delay_seconds: Pause between committed batches
             
         Returns:
             Tuple of (jobs_deleted, upload_files_deleted, output_dirs_deleted)
         """
         cutoff_date = datetime.utcnow() - timedelta(days=days_old)
-        
-        old_jobs = db.query(Job).filter(
-            Job.status == JobStatus.FAILED,
-            Job.completed_at < cutoff_date
-        ).all()
-        
-        jobs_deleted = 0
-        upload_files_deleted = 0
-        output_dirs_deleted = 0
-        
-        for job in old_jobs:
+
+        def log_job(job) -> None:
             logger.info(
                 "failed_job_cleanup",
                 job_id=str(job.id),
@@ -163,29 +350,24 @@ class CleanupService:
                 error=job.error_message,
                 dry_run=dry_run
             )
-            
-            if not dry_run:
-                # Delete associated metrics
-                db.query(Metric).filter(Metric.job_id == job.id).delete()
-                
-                # Delete files
-                upload_del, output_del = self.delete_job_files(job)
-                upload_files_deleted += upload_del
-                output_dirs_deleted += output_del
-                
-                # Delete job record
-                db.delete(job)
-                jobs_deleted += 1
-        
-        if not dry_run:
-            db.commit()
-        
-        return (jobs_deleted, upload_files_deleted, output_dirs_deleted)
+
+        return self._purge_jobs(
+            db,
+            (Job.status == JobStatus.FAILED, Job.completed_at < cutoff_date),
+            batch_size,
+            dry_run,
+            log_job,
+            inter_batch_delay_seconds,
+        )
     
     def cleanup_orphaned_files(self, db: Session, dry_run: bool = False) -> Tuple[int, int]:
         """
         Find and clean up files/directories with no corresponding job.
         
+        The filesystem is scanned first and only the job IDs found on disk
+        are looked up, so the cost follows the number of files rather than
+        the size of the jobs table.
+        
         Args:
             db: Database session
             dry_run: If True, only report what would be deleted
@@ -193,63 +375,129 @@ class CleanupService:
         Returns:
             Tuple of (orphaned_uploads_deleted, orphaned_outputs_deleted)
         """
-        # Get all job IDs from database
-        all_jobs = db.query(Job).all()
-        valid_job_ids = {str(job.id) for job in all_jobs}
+        # The two directory scans are independent I/O - run them concurrently
+        pool = _get_file_io_pool()
+        uploads_scan = pool.submit(self._scan_upload_candidates)
+        outputs_scan = pool.submit(self._scan_output_candidates)
+        upload_candidates = uploads_scan.result()
+        output_candidates = outputs_scan.result()
         
-        orphaned_uploads = 0
-        orphaned_outputs = 0
+        existing_job_ids = self._existing_job_ids(
+            db, {job_id for job_id, _ in upload_candidates} | {job_id for job_id, _ in output_candidates}
+        )
         
-        # Check upload files
-        if self.uploads_dir.exists():
-            for upload_file in self.uploads_dir.glob("*"):
-                if not upload_file.is_file():
-                    continue
-                
-                # Extract UUID from filename (format: uuid_filename.ext)
-                filename = upload_file.name
-                if '_' in filename:
-                    potential_uuid = filename.split('_')[0]
-                    if len(potential_uuid) == 36:  # UUID length
-                        if potential_uuid not in valid_job_ids:
-                            logger.info(
-                                "orphaned_upload_found",
-                                file=filename,
-                                dry_run=dry_run
-                            )
-                            
-                            if not dry_run:
-                                try:
-                                    upload_file.unlink()
-                                    orphaned_uploads += 1
-                                except Exception as e:
-                                    logger.warning("orphaned_upload_delete_failed", file=filename, error=str(e))
+        orphaned_upload_files = []
+        for job_id, upload_file in upload_candidates:
+            if job_id not in existing_job_ids:
+                logger.info(
+                    "orphaned_upload_found",
+                    file=upload_file.name,
+                    dry_run=dry_run
+                )
+                orphaned_upload_files.append(upload_file)
         
-        # Check output directories
-        if self.outputs_dir.exists():
-            for output_dir in self.outputs_dir.iterdir():
-                if not output_dir.is_dir():
-                    continue
-                
-                dir_name = output_dir.name
-                if len(dir_name) == 36:  # UUID length
-                    if dir_name not in valid_job_ids:
-                        logger.info(
-                            "orphaned_output_found",
-                            directory=dir_name,
-                            dry_run=dry_run
-                        )
-                        
-                        if not dry_run:
-                            try:
-                                import shutil
-                                shutil.rmtree(output_dir)
-                                orphaned_outputs += 1
-                            except Exception as e:
-                                logger.warning("orphaned_output_delete_failed", directory=dir_name, error=str(e))
+        orphaned_output_dirs = []
+        for job_id, output_dir in output_candidates:
+            if job_id not in existing_job_ids:
+                logger.info(
+                    "orphaned_output_found",
+                    directory=output_dir.name,
+                    dry_run=dry_run
+                )
+                orphaned_output_dirs.append(output_dir)
+        
+        if dry_run:
+            return (0, 0)
+        
+        orphaned_uploads = sum(pool.map(self._delete_orphaned_upload, orphaned_upload_files))
+        orphaned_outputs = sum(pool.map(self._delete_orphaned_output, orphaned_output_dirs))
         
         return (orphaned_uploads, orphaned_outputs)
     
+    @staticmethod
+    def _existing_job_ids(db: Session, candidate_ids: Set[str]) -> Set[str]:
+        """
+        Return the subset of candidate job IDs that exist in the database.
+
+        Args:
+            db: Database session
+            candidate_ids: Job IDs found on disk
+
+        Returns:
+            IDs of the candidates that have a job record
+        """
+        existing = set()
+        if not candidate_ids or db.query(Job.id).limit(1).first() is None:
+            # Nothing on disk, or no jobs at all - every candidate is orphaned
+            return existing
+
+        candidates = sorted(candidate_ids)
+        for start in range(0, len(candidates), ORPHAN_ID_QUERY_CHUNK):
+            chunk = candidates[start:start + ORPHAN_ID_QUERY_CHUNK]
+            existing.update(
+                str(job_id) for (job_id,) in db.query(Job.id).filter(Job.id.in_(chunk))
+            )
+        return existing
+    
+    def _scan_upload_candidates(self) -> List[Tuple[str, Path]]:
+        """
+        List upload files named with a UUID prefix.
+
+        Returns:
+            (UUID, path) for every upload file named "<uuid>_<filename>"
+        """
+        candidates = []
+        if not self.uploads_dir.exists():
+            return candidates
+
+        # One scandir pass; DirEntry caches the file type
+        with os.scandir(self.uploads_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                # Extract UUID from filename (format: uuid_filename.ext)
+                match = _UUID_PREFIX_RE.match(entry.name)
+                if match:
+                    candidates.append((match.group(1), Path(entry.path)))
+        return candidates
+    
+    def _scan_output_candidates(self) -> List[Tuple[str, Path]]:
+        """
+        List output directories named by a UUID.
+
+        Returns:
+            (UUID, path) for every output directory named "<uuid>"
+        """
+        candidates = []
+        if not self.outputs_dir.exists():
+            return candidates
+
+        with os.scandir(self.outputs_dir) as entries:
+            for entry in entries:
+                if entry.is_dir() and _UUID_RE.fullmatch(entry.name):
+                    candidates.append((entry.name, Path(entry.path)))
+        return candidates
+    
+    @staticmethod
+    def _delete_orphaned_upload(upload_file: Path) -> int:
+        """Delete an orphaned upload file; returns 1 if deleted, 0 on failure."""
+        try:
+            upload_file.unlink()
+            return 1
+        except Exception as e:
+            logger.warning("orphaned_upload_delete_failed", file=upload_file.name, error=str(e))
+            return 0
+    
+    @staticmethod
+    def _delete_orphaned_output(output_dir: Path) -> int:
+        """Delete an orphaned output directory; returns 1 if deleted, 0 on failure."""
+        try:
+            _remove_tree(output_dir)
+            return 1
+        except Exception as e:
+            logger.warning("orphaned_output_delete_failed", directory=output_dir.name, error=str(e))
+            return 0
+    
     def get_storage_stats(self) -> dict:
         """
         Get storage usage statistics.
@@ -263,16 +511,27 @@ class CleanupService:
         output_count = 0
         
         if self.uploads_dir.exists():
-            for f in self.uploads_dir.glob("*"):
-                if f.is_file():
-                    upload_size += f.stat().st_size
-                    upload_count += 1
+            with os.scandir(self.uploads_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        upload_size += entry.stat().st_size
+                        upload_count += 1
         
         if self.outputs_dir.exists():
-            for d in self.outputs_dir.iterdir():
-                if d.is_dir():
-                    output_size += sum(f.stat().st_size for f in d.rglob("*") if f.is_file())
-                    output_count += 1
+            with os.scandir(self.outputs_dir) as entries:
+                output_dirs = [entry for entry in entries if entry.is_dir()]
+            output_count = len(output_dirs)
+
+            fast_size = _find_job_files_size(self.outputs_dir) if settings.fast_storage_stats else None
+            if fast_size is not None:
+                output_size = fast_size
+            else:
+                # Job output trees are independent - measure them concurrently.
+                # Symlinked job directories are skipped, as find does.
+                output_size = sum(_get_file_io_pool().map(
+                    _directory_size,
+                    [entry.path for entry in output_dirs if not entry.is_symlink()],
+                ))
         
         return {
             "uploads": {
@@ -6,12 +6,16 @@ providing resilience against system sleep/shutdown events.
 """
 
 import threading
-import time
 import signal
-import sys
 import os
+from datetime import datetime, timedelta
 from typing import Optional
 
+from sqlalchemy import and_, or_
+
+from backend.core.database import SessionLocal
+from backend.models.job import Job, JobStatus
+from backend.services.job_service import JobService
 from backend.services.task_management_service import TaskManagementService
 from backend.core.logging import get_logger
 
@@ -38,6 +42,7 @@ class JobMonitor:
         self.cleanup_grace_period_minutes = cleanup_grace_period_minutes
         self.monitor_thread: Optional[threading.Thread] = None
         self.running = False
+        self._wake_event = threading.Event()  # Set by stop_monitoring() to end the current wait
         self.pid_file = "job_monitor.pid"
         self.tracked_stuck_jobs = {}  # Track stuck jobs with timestamps
 
@@ -51,6 +56,7 @@ class JobMonitor:
             return
 
         self.running = True
+        self._wake_event.clear()
         self.monitor_thread = threading.Thread(
             target=self._monitor_loop,
             name="JobMonitor",
@@ -68,6 +74,7 @@ class JobMonitor:
     def stop_monitoring(self):
         """Stop the background monitoring."""
         self.running = False
+        self._wake_event.set()  # Interrupt the wait so the thread exits promptly
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
 
@@ -77,6 +84,11 @@ class JobMonitor:
 
         logger.info("background_job_monitoring_stopped")
 
+    def _wait(self, timeout: float):
+        """Block until timeout elapses or stop_monitoring() is called."""
+        self._wake_event.wait(timeout)
+        self._wake_event.clear()
+
     def _monitor_loop(self):
         """
         Main monitoring loop that runs in background thread.
@@ -84,6 +96,10 @@ class JobMonitor:
         """
         logger.info("job_monitor_loop_started")
 
+        # One session for the life of the loop; each check ends its transaction,
+        # so the pooled connection is only held while a check runs
+        session = SessionLocal()
+
         while self.running:
             try:
                 # Run maintenance check
@@ -98,15 +114,12 @@ class JobMonitor:
 
                 # Check for and process pending jobs
                 try:
-                    from backend.core.database import SessionLocal
-                    from backend.services.job_service import JobService
-                    from backend.models.job import Job, JobStatus
-                    from datetime import datetime, timedelta
-
-                    db = SessionLocal()
+                    db = session
                     try:
-                        pending_count = JobService.count_jobs_by_status(db, ['PENDING'])
-                        running_count = JobService.count_jobs_by_status(db, ['RUNNING'])
+                        # One grouped COUNT instead of a query per status
+                        job_counts = JobService.count_jobs_grouped(db)
+                        pending_count = job_counts[JobStatus.PENDING]
+                        running_count = job_counts[JobStatus.RUNNING]
 
                         if pending_count > 0 and running_count == 0:
                             logger.info("monitor_found_pending_jobs_processing_queue",
@@ -117,14 +130,24 @@ class JobMonitor:
                                        pending_count=pending_count,
                                        running_count=running_count)
 
+                        # Remove cancelled jobs whose delayed cleanup in the API never ran
+                        purged_count = JobService.purge_cancelled_jobs(db)
+                        if purged_count:
+                            logger.info("monitor_purged_cancelled_jobs", count=purged_count)
+
                         # Check for stuck jobs and implement grace period cleanup
                         now = datetime.utcnow()
                         grace_period = timedelta(minutes=self.cleanup_grace_period_minutes)
 
-                        # Find running jobs stuck for > 2 hours
+                        # Find running jobs stuck for > 2 hours (claimed jobs a worker
+                        # never started have no started_at, so use created_at for those)
+                        stuck_cutoff = now - timedelta(hours=2)
                         stuck_running = db.query(Job).filter(
                             Job.status == JobStatus.RUNNING,
-                            Job.started_at < (now - timedelta(hours=2))
+                            or_(
+                                Job.started_at < stuck_cutoff,
+                                and_(Job.started_at.is_(None), Job.created_at < stuck_cutoff),
+                            )
                         ).all()
 
                         # Find pending jobs stuck for > 24 hours
@@ -181,20 +204,22 @@ class JobMonitor:
                                                error=str(cleanup_error))
 
                     finally:
-                        db.close()
+                        # Release the connection and expire loaded jobs so the next check reads fresh state
+                        db.rollback()
 
                 except Exception as queue_error:
                     logger.warning("job_queue_processing_failed_in_monitor",
                                  error=str(queue_error))
 
-                # Sleep until next check
-                time.sleep(self.check_interval)
+                # Wait until next check (or until stopped)
+                self._wait(self.check_interval)
 
             except Exception as e:
                 logger.error("job_monitor_error", error=str(e), exc_info=True)
                 # Continue monitoring despite errors
-                time.sleep(min(self.check_interval, 30))  # Don't spam on errors
+                self._wait(min(self.check_interval, 30))  # Don't spam on errors
 
+        session.close()
         logger.info("job_monitor_loop_ended")
 
     def check_now(self):
@@ -210,12 +235,15 @@ class JobMonitor:
         return result
 
 
+# Set on SIGINT/SIGTERM to release the standalone main thread
+stop_event = threading.Event()
+
+
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully."""
     logger.info("job_monitor_received_signal", signal=signum)
-    if 'monitor' in globals():
-        monitor.stop_monitoring()
-    sys.exit(0)
+    # The main thread wakes from stop_event.wait() and stops the monitor
+    stop_event.set()
 
 
 # Global monitor instance for signal handling
@@ -250,10 +278,9 @@ if __name__ == "__main__":
         logger.info("starting_job_monitor_daemon", interval=args.interval)
         monitor.start_background_monitoring()
 
-        # Keep running until signal
+        # Keep running until signal (blocks without waking up periodically)
         try:
-            while True:
-                time.sleep(1)
+            stop_event.wait()
         except KeyboardInterrupt:
             pass
         finally:
@@ -264,9 +291,9 @@ if __name__ == "__main__":
         monitor.start_background_monitoring()
 
         try:
-            while True:
-                time.sleep(1)
+            stop_event.wait()
         except KeyboardInterrupt:
-            logger.info("interactive_monitor_stopped")
+            pass
         finally:
+            logger.info("interactive_monitor_stopped")
             monitor.stop_monitoring()
@@ -5,7 +5,6 @@ Continuously monitors for PENDING jobs and processes them when no jobs are runni
 This replaces the missing Celery worker functionality for desktop applications.
 """
 
-import time
 import threading
 from typing import Optional
 
@@ -13,7 +12,6 @@ from sqlalchemy.orm import Session
 from backend.core.config import get_settings
 from backend.core.database import SessionLocal
 from backend.core.logging import get_logger
-from backend.models.job import JobStatus
 from backend.services import JobService
 from backend.services.task_service import TaskService
 
@@ -28,6 +26,7 @@ class JobQueueProcessor:
         self.running = False
         self.thread: Optional[threading.Thread] = None
         self.check_interval = 5  # Check for pending jobs every 5 seconds
+        self._wake_event = threading.Event()  # Set to check before the interval elapses
 
     def start(self):
         """Start the job queue processor in a background thread."""
@@ -37,6 +36,7 @@ class JobQueueProcessor:
 
         logger.info("Starting job queue processor")
         self.running = True
+        self._wake_event.clear()
         self.thread = threading.Thread(
             target=self._process_queue,
             name="job-queue-processor",
@@ -48,50 +48,53 @@ class JobQueueProcessor:
         """Stop the job queue processor."""
         logger.info("Stopping job queue processor")
         self.running = False
+        self._wake_event.set()  # Interrupt the wait so the thread exits promptly
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=10)
 
+    def wake(self):
+        """Check for pending jobs now (e.g. right after a job was submitted)."""
+        self._wake_event.set()
+
     def _process_queue(self):
         """Main queue processing loop."""
         logger.info("Job queue processor started")
 
+        # One session for the life of the loop; each check ends its transaction,
+        # so the pooled connection is only held while a check runs
+        db: Session = SessionLocal()
+
         while self.running:
             try:
-                self._check_and_process_pending_jobs()
+                self._check_and_process_pending_jobs(db)
             except Exception as e:
                 logger.error("Error in job queue processor", error=str(e), exc_info=True)
 
-            # Wait before next check
-            time.sleep(self.check_interval)
+            # Wait before next check, unless woken early
+            self._wake_event.wait(self.check_interval)
+            self._wake_event.clear()
 
+        db.close()
         logger.info("Job queue processor stopped")
 
-    def _check_and_process_pending_jobs(self):
+    def _check_and_process_pending_jobs(self, db: Session):
         """Check for pending jobs and start processing if possible."""
-        db: Session = SessionLocal()
-
         try:
-            # Count running jobs
-            running_jobs = JobService.count_jobs_by_status(db, [JobStatus.RUNNING])
-
-            if running_jobs > 0:
-                # There's already a job running, don't start another
-                return
-
-            # Find the oldest pending job
-            pending_job = JobService.get_oldest_pending_job(db)
-
-            if pending_job:
-                logger.info("Found pending job, starting processing", job_id=str(pending_job.id))
-                self._start_job_processing(pending_job.id)
-            else:
-                # No pending jobs, nothing to do
-                pass
+            # Fill the free slots up to MAX_CONCURRENT_JOBS (default 1: one job at a time).
+            # Each job is claimed (PENDING -> RUNNING) before it is submitted, so a job
+            # waiting in the executor is never seen as pending and submitted again
+            for _ in range(settings.max_concurrent_jobs):
+                job_id = JobService.claim_next_pending_job(db, settings.max_concurrent_jobs)
+                if job_id is None:
+                    break
+                logger.info("Found pending job, starting processing", job_id=job_id)
+                self._start_job_processing(job_id)
 
         except Exception as e:
             logger.error("Error checking pending jobs", error=str(e))
         finally:
-            db.close()
+            # Release the connection and expire loaded jobs so the next check reads fresh state
+            db.rollback()
 
     def _start_job_processing(self, job_id):
         """Start processing a pending job."""
@@ -112,6 +115,8 @@ class JobQueueProcessor:
                     logger.error("Job processing failed", job_id=str(job_id), error=str(e), exc_info=True)
                 finally:
                     db.close()
+                    # A slot just freed up; start the next pending job without waiting for the poll
+                    self.wake()
 
             # Submit to task service
             TaskService.submit_task(process_async)
@@ -146,6 +151,12 @@ def stop_job_queue_processor():
         logger.info("Job queue processor stopped globally")
 
 
+def wake_job_queue_processor():
+    """Wake the global job queue processor, if running, to check for pending jobs now."""
+    if _processor_instance:
+        _processor_instance.wake()
+
+
 def get_processor_status():
     """Get the status of the job queue processor."""
     global _processor_instance
@@ -5,22 +5,45 @@ This service provides business logic for creating, retrieving,
 and updating jobs in the system.
 """
 
-from datetime import datetime
-from typing import List, Optional
+import subprocess
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy.orm import Session
-
-from datetime import datetime
+from sqlalchemy import bindparam, delete, func, or_, select, tuple_, update
+from sqlalchemy.orm import Session, selectinload
 
+from backend.core.config import get_settings
+from backend.core.database import SessionLocal
 from backend.core.logging import get_logger
-from backend.models import Job, Metric
-from backend.models.job import JobStatus
+from backend.models import Job
+from backend.models.job import ACTIVE_STATUSES, JobStatus
 from backend.schemas import JobCreate, JobUpdate, JobResponse
+from backend.services.cleanup_service import CleanupService
+from backend.services.task_management_service import TaskManagementService
 
 logger = get_logger(__name__)
 
 
+def _job_id_str(job_id) -> str:
+    """Canonical string form of a job ID; string IDs are passed through untouched."""
+    return job_id if isinstance(job_id, str) else str(job_id)
+
+
+# Seconds a cancelled job's processes get to exit before its files are removed
+CANCELLED_JOB_CLEANUP_DELAY_SECONDS = 2
+
+# PostgreSQL advisory lock key serialising claim_next_pending_job across processes
+JOB_CLAIM_LOCK_KEY = 0x4E494A51
+
+# Hot lookups built once; SQLAlchemy caches their compiled SQL, and reusing
+# the construct skips rebuilding a Query on every call
+_GET_JOB_WITH_METRICS = select(Job)\
+    .options(selectinload(Job.metrics))\
+    .where(Job.id == bindparam("job_id"))
+
+
 class JobService:
     """
     Service class for job-related operations.
@@ -80,16 +103,9 @@ class JobService:
             Job instance if found, None otherwise
         """
         # Convert to string for SQLite compatibility (VARCHAR(36) with dashes)
-        job_id_str = str(job_id)
-        job = db.query(Job).filter(Job.id == job_id_str).first()
-
-        # Ensure metrics have laterality computed
-        if job and job.metrics:
-            for metric in job.metrics:
-                # Force computation of laterality property to ensure it's available
-                _ = metric.laterality
-
-        return job
+        job_id_str = _job_id_str(job_id)
+        # Load metrics in one extra IN query rather than lazily per access
+        return db.execute(_GET_JOB_WITH_METRICS, {"job_id": job_id_str}).scalar_one_or_none()
 
     @staticmethod
     def get_job_response(db: Session, job_id) -> Optional[JobResponse]:
@@ -107,59 +123,40 @@ class JobService:
         if not job:
             return None
 
-        # Convert to dict for modification
-        job_dict = {
-            'id': job.id,
-            'filename': job.filename,
-            'file_path': job.file_path,
-            'status': job.status,
-            'error_message': job.error_message,
-            'created_at': job.created_at,
-            'started_at': job.started_at,
-            'completed_at': job.completed_at,
-            'result_path': job.result_path,
-            'progress': job.progress,
-            'current_step': job.current_step,
-            'patient_name': job.patient_name,
-            'patient_id': job.patient_id,
-            'patient_age': job.patient_age,
-            'patient_sex': job.patient_sex,
-            'scanner_info': job.scanner_info,
-            'sequence_info': job.sequence_info,
-            'notes': job.notes,
-            'metrics': []
-        }
-
-        # Add metrics with computed laterality
-        for metric in job.metrics:
-            metric_dict = {
-                'id': metric.id,
-                'region': metric.region,
-                'left_volume': metric.left_volume,
-                'right_volume': metric.right_volume,
-                'asymmetry_index': metric.asymmetry_index,
-                'laterality': metric.laterality  # This will compute the property
-            }
-            job_dict['metrics'].append(metric_dict)
-
-        # Convert back to JobResponse
-        return JobResponse(**job_dict)
+        return JobService.build_job_response(job)
+
+    @staticmethod
+    def build_job_response(job: Job) -> JobResponse:
+        """
+        Build a JobResponse with computed laterality from a loaded job.
+
+        Args:
+            job: Job instance
+
+        Returns:
+            JobResponse instance
+        """
+        # Reads columns and each metric's laterality property straight from the ORM objects
+        return JobResponse.model_validate(job)
     
     @staticmethod
     def get_jobs(
         db: Session,
         skip: int = 0,
         limit: int = 100,
-        status: Optional[JobStatus] = None
+        status: Optional[JobStatus] = None,
+        cursor: Optional[Tuple[datetime, str]] = None,
     ) -> List[Job]:
         """
-        Retrieve multiple jobs with optional filtering.
+        Retrieve multiple jobs with optional filtering, newest first.
         
         Args:
             db: Database session
-            skip: Number of records to skip (pagination)
+            skip: Number of records to skip (offset pagination, ignored with cursor)
             limit: Maximum number of records to return
             status: Filter by job status (optional)
+            cursor: (created_at, id) of the last job on the previous page;
+                seeks past it on the index instead of scanning skipped rows
         
         Returns:
             List of job instances
@@ -169,7 +166,15 @@ class JobService:
         if status:
             query = query.filter(Job.status == status)
         
-        return query.order_by(Job.created_at.desc()).offset(skip).limit(limit).all()
+        # id breaks ties between jobs created in the same instant
+        query = query.order_by(Job.created_at.desc(), Job.id.desc())
+        
+        if cursor is not None:
+            query = query.filter(tuple_(Job.created_at, Job.id) < tuple_(*cursor))
+        elif skip:
+            query = query.offset(skip)
+        
+        return query.limit(limit).all()
 
     @staticmethod
     def count_jobs_by_status(db: Session, statuses: List[JobStatus]) -> int:
@@ -185,6 +190,23 @@ class JobService:
         """
         return db.query(Job).filter(Job.status.in_(statuses)).count()
 
+    @staticmethod
+    def count_jobs_grouped(db: Session) -> Dict[JobStatus, int]:
+        """
+        Count jobs for every status in a single grouped query.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Mapping of each job status to its job count (0 if none)
+        """
+        counts = {status: 0 for status in JobStatus}
+        rows = db.query(Job.status, func.count(Job.id)).group_by(Job.status).all()
+        for status, count in rows:
+            counts[status] = count
+        return counts
+
     @staticmethod
     def get_oldest_pending_job(db: Session) -> Optional[Job]:
         """
@@ -201,6 +223,32 @@ class JobService:
                  .order_by(Job.created_at.asc())\
                  .first()
 
+    @staticmethod
+    def _update_job_row(db: Session, job_id_str: str, **values) -> Optional[Job]:
+        """
+        Apply column values to one job in a single UPDATE, without loading it first.
+        
+        Uses UPDATE ... RETURNING where the database supports it, so the
+        updated row comes back with the statement. The caller commits.
+        
+        Args:
+            db: Database session
+            job_id_str: Job identifier as a string
+            **values: Column values to set
+        
+        Returns:
+            Updated job instance if found, None otherwise
+        """
+        stmt = update(Job).where(Job.id == job_id_str).values(**values)
+        
+        if db.get_bind().dialect.update_returning:
+            return db.execute(stmt.returning(Job)).scalar_one_or_none()
+        
+        # Older SQLite without RETURNING: update, then read the row back
+        if db.execute(stmt).rowcount == 0:
+            return None
+        return db.get(Job, job_id_str)
+    
     @staticmethod
     def update_job(db: Session, job_id, job_update: JobUpdate) -> Optional[Job]:
         """
@@ -215,26 +263,28 @@ class JobService:
             Updated job instance if found, None otherwise
         """
         # Convert to string for SQLite compatibility
-        job_id_str = str(job_id)
-        job = db.query(Job).filter(Job.id == job_id_str).first()
-        
-        if not job:
-            logger.warning("job_not_found", job_id=str(job_id))
-            return None
+        job_id_str = _job_id_str(job_id)
         
         # Update fields if provided
         update_data = job_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(job, field, value)
+        if update_data:
+            job = JobService._update_job_row(db, job_id_str, **update_data)
+        else:
+            job = db.get(Job, job_id_str)
         
+        if not job:
+            logger.warning("job_not_found", job_id=job_id_str)
+            return None
+        
+        # Read before commit, which expires the instance
+        status = job.status.value
         db.commit()
-        db.refresh(job)
         
         logger.info(
             "job_updated",
-            job_id=str(job.id),
+            job_id=job_id_str,
             updates=list(update_data.keys()),
-            status=job.status.value,
+            status=status,
         )
         
         return job
@@ -248,7 +298,7 @@ class JobService:
         1. Cancel/revoke the Celery task
         2. Terminate FastSurfer processes (if running)
         3. Mark job as CANCELLED (if active)
-        4. Delete files after a brief delay
+        4. Schedule file and record deletion after a brief delay
         
         For COMPLETED or FAILED jobs, this will:
         1. Immediately delete files and database records
@@ -261,11 +311,11 @@ class JobService:
             True if deleted, False if not found
         """
         # Convert to string for SQLite compatibility
-        job_id_str = str(job_id)
-        job = db.query(Job).filter(Job.id == job_id_str).first()
+        job_id_str = _job_id_str(job_id)
+        job = db.get(Job, job_id_str)
         
         if not job:
-            logger.warning("job_not_found", job_id=str(job_id))
+            logger.warning("job_not_found", job_id=job_id_str)
             return False
         
         job_status = job.status
@@ -273,14 +323,13 @@ class JobService:
         
         # Handle active jobs (PENDING or RUNNING)
         if is_active:
-            logger.info("cancelling_active_job", job_id=str(job_id), status=job_status.value)
+            logger.info("cancelling_active_job", job_id=job_id_str, status=job_status.value)
             
             # Kill Docker container if running
             if job.docker_container_id:
                 try:
-                    import subprocess
                     logger.info("killing_docker_container", 
-                               job_id=str(job_id), 
+                               job_id=job_id_str, 
                                container_id=job.docker_container_id)
                     
                     # Stop the container (will kill the subprocess too)
@@ -292,69 +341,159 @@ class JobService:
                     
                     if result.returncode == 0:
                         logger.info("docker_container_killed", 
-                                   job_id=str(job_id), 
+                                   job_id=job_id_str, 
                                    container_id=job.docker_container_id)
                     else:
                         logger.warning("docker_container_kill_failed",
-                                      job_id=str(job_id),
+                                      job_id=job_id_str,
                                       container_id=job.docker_container_id,
                                       stderr=result.stderr.decode() if result.stderr else "")
                 except Exception as e:
                     logger.warning("docker_container_kill_error", 
-                                  job_id=str(job_id), 
+                                  job_id=job_id_str, 
                                   error=str(e))
             
             # Cancel Celery task and terminate FastSurfer
             try:
-                from backend.services import TaskManagementService
-                TaskManagementService.cancel_job_task(job_id, job_status.value)
+                TaskManagementService.cancel_job_task(job_id_str, job_status.value)
             except Exception as e:
-                logger.warning("task_cancellation_failed", job_id=str(job_id), error=str(e))
+                logger.warning("task_cancellation_failed", job_id=job_id_str, error=str(e))
                 # Continue with deletion even if cancellation fails
             
-            # Mark job as CANCELLED instead of deleting immediately
-            job.status = JobStatus.CANCELLED
-            job.completed_at = datetime.utcnow()
-            job.error_message = "Job cancelled by user"
-            job.docker_container_id = None  # Clear container ID
+            # Mark job as CANCELLED instead of deleting immediately. The status
+            # guard makes this a compare-and-set: a worker that completed or
+            # failed the job meanwhile is not overwritten
+            cancelled = db.execute(
+                update(Job)
+                .where(Job.id == job_id_str, Job.status.in_(ACTIVE_STATUSES))
+                .values(
+                    status=JobStatus.CANCELLED,
+                    completed_at=datetime.utcnow(),
+                    error_message="Job cancelled by user",
+                    docker_container_id=None,  # Clear container ID
+                )
+                .execution_options(synchronize_session=False)
+            ).rowcount
             db.commit()
             
-            # Wait a moment for processes to terminate gracefully
-            import time
-            time.sleep(2)
+            if not cancelled:
+                # Finished while we were stopping it; nothing left to wait for
+                logger.info("job_finished_before_cancel", job_id=job_id_str)
+                return JobService.purge_job(db, job_id_str)
             
-            logger.info("job_marked_cancelled", job_id=str(job_id))
+            logger.info("job_marked_cancelled", job_id=job_id_str)
+            
+            # Give processes a moment to terminate before removing their files and
+            # starting the next job, without holding this request (or its
+            # transaction) open meanwhile
+            timer = threading.Timer(
+                CANCELLED_JOB_CLEANUP_DELAY_SECONDS,
+                JobService._finish_cancellation,
+                args=(job_id_str,),
+            )
+            timer.daemon = True
+            timer.start()
+            logger.info("cancelled_job_cleanup_scheduled",
+                       job_id=job_id_str,
+                       delay_seconds=CANCELLED_JOB_CLEANUP_DELAY_SECONDS)
+            
+            return True
+        
+        return JobService.purge_job(db, job_id_str)
+    
+    @staticmethod
+    def _finish_cancellation(job_id_str: str) -> None:
+        """
+        Purge a cancelled job once its grace period has passed, then start the next pending job.
+        
+        Runs on a timer thread, so it uses its own database session.
+        
+        Args:
+            job_id_str: Job identifier
+        """
+        db = SessionLocal()
+        try:
+            JobService.purge_job(db, job_id_str)
+            
+            # The cancelled job no longer holds a slot, so start the next pending job
+            try:
+                JobService._start_next_pending_job(db)
+            except Exception as e:
+                logger.warning("failed_to_auto_start_next_job_after_deletion", error=str(e))
+        except Exception as e:
+            logger.error("cancelled_job_cleanup_failed", job_id=job_id_str, error=str(e), exc_info=True)
+        finally:
+            db.close()
+    
+    @staticmethod
+    def purge_cancelled_jobs(db: Session, older_than_seconds: float = CANCELLED_JOB_CLEANUP_DELAY_SECONDS) -> int:
+        """
+        Purge cancelled jobs whose cleanup grace period has passed.
+        
+        delete_job purges a cancelled job from a timer in the API process, and
+        that timer is lost if the process stops within the grace period. This
+        sweep (run by the job monitor) removes any such leftover jobs and files.
+        
+        Args:
+            db: Database session
+            older_than_seconds: Only purge jobs cancelled at least this long ago
+        
+        Returns:
+            Number of jobs purged
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=older_than_seconds)
+        job_ids = db.execute(
+            select(Job.id).where(
+                Job.status == JobStatus.CANCELLED,
+                or_(Job.completed_at < cutoff, Job.completed_at.is_(None)),
+            )
+        ).scalars().all()
+        
+        return sum(1 for job_id in job_ids if JobService.purge_job(db, job_id))
+    
+    @staticmethod
+    def purge_job(db: Session, job_id) -> bool:
+        """
+        Delete a job's files and database records.
         
-        # Delete associated metrics (use string format for SQLite)
-        db.query(Metric).filter(Metric.job_id == job_id_str).delete()
+        Called directly for finished jobs, and from a timer after
+        CANCELLED_JOB_CLEANUP_DELAY_SECONDS (or the job monitor's
+        purge_cancelled_jobs sweep) for jobs cancelled while active.
+        
+        Args:
+            db: Database session
+            job_id: Job identifier
+        
+        Returns:
+            True if deleted, False if not found
+        """
+        job_id_str = _job_id_str(job_id)
+        job = db.get(Job, job_id_str)
+        
+        if not job:
+            logger.warning("job_not_found", job_id=job_id_str)
+            return False
+        
+        job_status = job.status
         
         # Delete associated files (upload and output directory)
         try:
-            from backend.services import CleanupService
             cleanup_service = CleanupService()
             cleanup_service.delete_job_files(job)
         except Exception as e:
-            logger.warning("file_cleanup_failed_during_job_delete", job_id=str(job_id), error=str(e))
+            logger.warning("file_cleanup_failed_during_job_delete", job_id=job_id_str, error=str(e))
             # Continue with database deletion even if file deletion fails
         
-        # Delete job record
-        db.delete(job)
+        # Delete job record; its metrics go with it via ON DELETE CASCADE
+        db.execute(delete(Job).where(Job.id == job_id_str))
         db.commit()
         
         logger.info(
             "job_deleted_with_files",
-            job_id=str(job_id),
+            job_id=job_id_str,
             previous_status=job_status.value,
-            was_active=is_active
         )
         
-        # If we deleted a running or pending job, try to start the next pending job
-        if is_active:
-            try:
-                JobService._start_next_pending_job(db)
-            except Exception as e:
-                logger.warning("failed_to_auto_start_next_job_after_deletion", error=str(e))
-        
         return True
     
     @staticmethod
@@ -370,19 +509,19 @@ class JobService:
             Updated job instance if found, None otherwise
         """
         # Convert to string for SQLite compatibility
-        job_id_str = str(job_id)
-        job = db.query(Job).filter(Job.id == job_id_str).first()
+        job_id_str = _job_id_str(job_id)
+        job = JobService._update_job_row(
+            db, job_id_str,
+            status=JobStatus.RUNNING,
+            started_at=datetime.utcnow(),
+        )
         
         if not job:
             return None
         
-        job.status = JobStatus.RUNNING
-        job.started_at = datetime.utcnow()
-        
         db.commit()
-        db.refresh(job)
         
-        logger.info("job_started", job_id=str(job.id))
+        logger.info("job_started", job_id=job_id_str)
         
         return job
     
@@ -404,23 +543,25 @@ class JobService:
             Updated job instance if found, None otherwise
         """
         # Convert to string for SQLite compatibility
-        job_id_str = str(job_id)
-        job = db.query(Job).filter(Job.id == job_id_str).first()
+        job_id_str = _job_id_str(job_id)
+        job = JobService._update_job_row(
+            db, job_id_str,
+            status=JobStatus.COMPLETED,
+            completed_at=datetime.utcnow(),
+            result_path=result_path,
+        )
         
         if not job:
             return None
         
-        job.status = JobStatus.COMPLETED
-        job.completed_at = datetime.utcnow()
-        job.result_path = result_path
-        
+        # Read before commit, which expires the instance
+        duration_seconds = job.duration_seconds
         db.commit()
-        db.refresh(job)
         
         logger.info(
             "job_completed",
-            job_id=str(job.id),
-            duration_seconds=job.duration_seconds,
+            job_id=job_id_str,
+            duration_seconds=duration_seconds,
         )
 
         # Trigger queue processing to start next pending job
@@ -442,22 +583,22 @@ class JobService:
             Updated job instance if found, None otherwise
         """
         # Convert to string for SQLite compatibility
-        job_id_str = str(job_id)
-        job = db.query(Job).filter(Job.id == job_id_str).first()
+        job_id_str = _job_id_str(job_id)
+        job = JobService._update_job_row(
+            db, job_id_str,
+            status=JobStatus.FAILED,
+            completed_at=datetime.utcnow(),
+            error_message=error_message,
+        )
         
         if not job:
             return None
         
-        job.status = JobStatus.FAILED
-        job.completed_at = datetime.utcnow()
-        job.error_message = error_message
-        
         db.commit()
-        db.refresh(job)
         
         logger.error(
             "job_failed",
-            job_id=str(job.id),
+            job_id=job_id_str,
             error=error_message,
         )
 
@@ -472,78 +613,125 @@ class JobService:
         """
         Check for pending jobs and start the next one if capacity allows.
         
-        This should be called whenever a job completes or fails.
+        This should be called whenever a job completes or fails. Jobs are
+        only claimed and dispatched to Celery while a worker answers a ping.
         """
         try:
-            # Check current running jobs
-            running_jobs = db.query(Job).filter(Job.status == JobStatus.RUNNING).count()
-            # Import settings properly
-            from backend.core.config import Settings
-            settings = Settings()
-            if running_jobs < settings.max_concurrent_jobs:
-                pending_job = db.query(Job).filter(
-                    Job.status == JobStatus.PENDING
-                ).order_by(Job.created_at.asc()).first()
-                
-                if pending_job:
-                    logger.info("starting_queued_job", 
-                              job_id=str(pending_job.id), 
-                              queue_position="next_pending")
-                    
-                    # Start the job
-                    try:
-                        # Import here to avoid circular imports
-                        from workers.tasks.processing_web import process_mri_task
-                        task = process_mri_task.delay(str(pending_job.id))
-                        logger.info("queued_job_task_submitted", 
-                                  job_id=str(pending_job.id), 
-                                  celery_task_id=task.id)
-                    except Exception as e:
-                        logger.error("failed_to_start_queued_job", 
-                                   job_id=str(pending_job.id), 
-                                   error=str(e))
+            try:
+                # Import here to avoid circular imports
+                from workers.tasks.processing_web import process_mri_task
+            except ImportError as e:
+                logger.info("job_queue_celery_unavailable", error=str(e))
+                return
+            
+            # Publishing succeeds even when no worker consumes the broker (e.g. the
+            # SQLite fallback broker in desktop mode), and a claimed job would then
+            # hold a slot with nobody running it. Leave it PENDING instead, for a
+            # worker or the in-process queue processor to pick up.
+            if not TaskManagementService.celery_worker_available(process_mri_task.app):
+                logger.info("job_queue_no_celery_worker")
+                return
+            
+            job_id = JobService.claim_next_pending_job(db)
+            if job_id is None:
+                return
+            
+            logger.info("starting_queued_job", 
+                      job_id=job_id, 
+                      queue_position="next_pending")
+            
+            # Start the job
+            try:
+                task = process_mri_task.delay(job_id)
+                logger.info("queued_job_task_submitted", 
+                          job_id=job_id, 
+                          celery_task_id=task.id)
+            except Exception as e:
+                logger.error("failed_to_start_queued_job", 
+                           job_id=job_id, 
+                           error=str(e))
+                # Hand the slot back so the job is picked up on the next pass
+                db.execute(
+                    update(Job)
+                    .where(Job.id == job_id, Job.status == JobStatus.RUNNING)
+                    .values(status=JobStatus.PENDING)
+                    .execution_options(synchronize_session=False)
+                )
+                db.commit()
         except Exception as e:
+            db.rollback()
             logger.error("job_queue_processing_failed", error=str(e))
     
+    @staticmethod
+    def claim_next_pending_job(db: Session, max_concurrent_jobs: Optional[int] = None) -> Optional[str]:
+        """
+        Atomically mark the oldest pending job RUNNING if capacity allows.
+        
+        Picking the job, the capacity check and the status change happen in
+        one conditional UPDATE. On PostgreSQL the claim first takes a
+        transaction-level advisory lock: under READ COMMITTED two claimers
+        would otherwise count the same running jobs and both succeed. SQLite
+        serialises writers, so the single statement is enough there.
+        
+        Every path that hands a pending job to a worker must claim it here
+        first. started_at is left for start_job, which the worker calls when
+        processing actually begins.
+        
+        Args:
+            db: Database session
+            max_concurrent_jobs: Maximum number of jobs allowed to run at once
+                (defaults to the MAX_CONCURRENT_JOBS setting)
+        
+        Returns:
+            ID of the claimed job, or None if nothing was claimed
+        """
+        if max_concurrent_jobs is None:
+            max_concurrent_jobs = get_settings().max_concurrent_jobs
+        
+        bind = db.get_bind()
+        if bind.dialect.name == "postgresql":
+            # Released when the transaction below commits
+            db.execute(select(func.pg_advisory_xact_lock(JOB_CLAIM_LOCK_KEY)))
+        
+        running_jobs = select(func.count(Job.id))\
+            .where(Job.status == JobStatus.RUNNING)\
+            .scalar_subquery()
+        claim = update(Job)\
+            .where(Job.status == JobStatus.PENDING, running_jobs < max_concurrent_jobs)\
+            .values(status=JobStatus.RUNNING)\
+            .execution_options(synchronize_session=False)
+        
+        if bind.dialect.update_returning:
+            oldest_pending = select(Job.id)\
+                .where(Job.status == JobStatus.PENDING)\
+                .order_by(Job.created_at.asc(), Job.id.asc())\
+                .limit(1)\
+                .scalar_subquery()
+            job_id = db.execute(claim.where(Job.id == oldest_pending).returning(Job.id)).scalar_one_or_none()
+        else:
+            # Older SQLite without RETURNING: pick the id first; the guarded
+            # UPDATE still only succeeds while the job is pending and a slot is free
+            job_id = db.execute(
+                select(Job.id)
+                .where(Job.status == JobStatus.PENDING)
+                .order_by(Job.created_at.asc(), Job.id.asc())
+                .limit(1)
+            ).scalar_one_or_none()
+            if job_id is not None and db.execute(claim.where(Job.id == job_id)).rowcount == 0:
+                job_id = None
+        db.commit()
+        
+        return job_id
+    
     @staticmethod
     def _start_next_pending_job(db: Session):
         """
-        Check for pending jobs and start the next one if no jobs are currently running.
+        Check for pending jobs and start the next one if capacity allows.
         
         This is called automatically after a job completes, fails, or is deleted.
+        It shares process_job_queue's claim, so it cannot double-dispatch a slot.
         
         Args:
             db: Database session
         """
-        try:
-            # Check if there are any running jobs
-            running_count = JobService.count_jobs_by_status(db, [JobStatus.RUNNING])
-            
-            if running_count > 0:
-                logger.info("job_already_running_skipping_auto_start", running_count=running_count)
-                return
-            
-            # Get the oldest pending job (FIFO queue)
-            pending_job = db.query(Job).filter(
-                Job.status == JobStatus.PENDING
-            ).order_by(Job.created_at.asc()).first()
-            
-            if not pending_job:
-                logger.info("no_pending_jobs_to_auto_start")
-                return
-            
-            # Start the pending job
-            logger.info("auto_starting_next_pending_job_after_completion", 
-                       job_id=str(pending_job.id), 
-                       filename=pending_job.filename)
-            
-            # Submit to Celery queue
-            from workers.tasks.processing_web import process_mri_task
-            task = process_mri_task.delay(str(pending_job.id))
-            logger.info("auto_started_pending_job_from_service", 
-                       job_id=str(pending_job.id), 
-                       celery_task_id=task.id,
-                       filename=pending_job.filename)
-            
-        except Exception as e:
-            logger.error("failed_to_auto_start_pending_job_from_service", error=str(e), exc_info=True)
+        JobService.process_job_queue(db)
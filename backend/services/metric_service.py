@@ -5,10 +5,11 @@ This service provides business logic for creating and retrieving
 hippocampal asymmetry metrics.
 """
 
-import json
 from typing import List, Optional
 from uuid import UUID
 
+import orjson
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from backend.core.logging import get_logger
@@ -17,6 +18,10 @@ from backend.schemas import MetricCreate
 
 logger = get_logger(__name__)
 
+# Hot lookups built once and reused, so each call only binds parameters
+_GET_METRIC = select(Metric).where(Metric.id == bindparam("metric_id"))
+_GET_METRICS_BY_JOB = select(Metric).where(Metric.job_id == bindparam("job_id"))
+
 
 class MetricService:
     """
@@ -85,16 +90,20 @@ class MetricService:
             for data in metrics_data
         ]
         
+        # Read before commit, which expires the instances
+        job_id = str(metrics[0].job_id) if metrics else None
+        regions = [metric.region for metric in metrics]
+        
+        # id and created_at are generated client-side, so there is nothing to
+        # refresh; attributes reload on first access if a caller needs them
         db.add_all(metrics)
         db.commit()
         
-        for metric in metrics:
-            db.refresh(metric)
-        
         logger.info(
             "metrics_created_bulk",
             count=len(metrics),
-            job_id=str(metrics[0].job_id) if metrics else None,
+            job_id=job_id,
+            regions=regions,
         )
         
         return metrics
@@ -113,7 +122,7 @@ class MetricService:
         """
         # Convert to string for SQLite compatibility
         metric_id_str = str(metric_id)
-        return db.query(Metric).filter(Metric.id == metric_id_str).first()
+        return db.execute(_GET_METRIC, {"metric_id": metric_id_str}).scalar_one_or_none()
     
     @staticmethod
     def get_metrics_by_job(db: Session, job_id) -> List[Metric]:
@@ -129,7 +138,7 @@ class MetricService:
         """
         # Convert to string for SQLite compatibility
         job_id_str = str(job_id)
-        return db.query(Metric).filter(Metric.job_id == job_id_str).all()
+        return db.execute(_GET_METRICS_BY_JOB, {"job_id": job_id_str}).scalars().all()
 
     @staticmethod
     def extract_metrics(db: Session, job_id: str, output_dir: str) -> List[Metric]:
@@ -152,25 +161,21 @@ class MetricService:
             return []
 
         try:
-            with open(metrics_file, 'r') as f:
-                metrics_data = json.load(f)
+            metrics_data = orjson.loads(metrics_file.read_bytes())
 
-            created_metrics = []
-            for metric_data in metrics_data:
-                # Create metric record
-                metric_create = MetricCreate(
+            metrics_create = [
+                MetricCreate(
                     job_id=job_id,
                     region=metric_data.get('region', 'Hippocampus'),
                     left_volume=metric_data.get('left_volume'),
                     right_volume=metric_data.get('right_volume'),
                     asymmetry_index=metric_data.get('asymmetry_index')
                 )
+                for metric_data in metrics_data
+            ]
 
-                metric = MetricService.create_metric(db, metric_create)
-                created_metrics.append(metric)
-
-            logger.info(f"Extracted and saved {len(created_metrics)} metrics for job {job_id}")
-            return created_metrics
+            # One transaction and one metrics_created_bulk log line for the whole file
+            return MetricService.create_metrics_bulk(db, metrics_create)
 
         except Exception as e:
             logger.error(f"Failed to extract metrics for job {job_id}: {e}")
@@ -5,8 +5,12 @@ This service abstracts file storage operations, supporting both
 local filesystem and S3-compatible (MinIO) storage backends.
 """
 
+import io
 import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import BinaryIO, Optional
 
@@ -25,6 +29,63 @@ from backend.core.logging import get_logger
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Copy chunk size for uploads; the 16 KiB default means tens of thousands of
+# read/write calls for a single multi-hundred-MB scan
+UPLOAD_COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+S3_URI_PREFIX = "s3://"
+
+# Waits between attempts when downloading an object from S3
+S3_DOWNLOAD_BACKOFF_SECONDS = (0.5, 1.0, 2.0)
+
+# Multipart chunk size for S3 uploads (MinIO's minimum is 5 MiB)
+S3_UPLOAD_PART_SIZE = 16 * 1024 * 1024
+
+# Uploads mirrored to S3 at the same time; the rest wait in the pool's queue
+S3_MIRROR_WORKERS = 4
+
+
+@lru_cache(maxsize=1)
+def _get_s3_mirror_pool() -> ThreadPoolExecutor:
+    """Shared pool that mirrors saved uploads to S3 off the request path."""
+    return ThreadPoolExecutor(max_workers=S3_MIRROR_WORKERS, thread_name_prefix="s3-mirror")
+
+
+def _copy_to_file(src: BinaryIO, dst: BinaryIO) -> None:
+    """
+    Copy the rest of src into an open destination file.
+
+    In-memory sources are written in one call straight from their buffer,
+    real files are copied in the kernel with sendfile where available, and
+    anything else falls back to a large-buffer copyfileobj.
+    """
+    if isinstance(src, io.BytesIO):
+        with src.getbuffer() as view:
+            dst.write(view[src.tell():])
+        src.seek(0, os.SEEK_END)
+        return
+
+    if hasattr(os, "sendfile"):
+        try:
+            in_fd = src.fileno()
+            offset = src.tell()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            in_fd = None
+        if in_fd is not None:
+            dst.flush()
+            try:
+                while True:
+                    sent = os.sendfile(dst.fileno(), in_fd, offset, UPLOAD_COPY_BUFFER_SIZE)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                # Not supported for this pair of files; finish with a regular copy
+                pass
+            src.seek(offset)
+
+    shutil.copyfileobj(src, dst, UPLOAD_COPY_BUFFER_SIZE)
+
 
 class StorageService:
     """
@@ -84,19 +145,21 @@ class StorageService:
         # Always persist locally first to guarantee availability for processing
         local_path = self._save_to_local(file, filename)
         
-        # Best-effort upload to S3 in background context (synchronous but non-blocking for processing)
+        # Best-effort mirror to S3 in the background; the request only waits for the local write
         if self.use_s3:
-            try:
-                # Upload from the local file to avoid file pointer issues
-                with open(local_path, "rb") as fsrc:
-                    self._save_to_s3(fsrc, filename)
-            except S3Error as e:
-                # Log but don't fail upload flow; processing will use local file
-                logger.warning("s3_upload_deferred", error=str(e), filename=filename)
+            _get_s3_mirror_pool().submit(self._mirror_to_s3, local_path, filename)
         
         # Return local path so downstream processing uses local file (avoids S3 read-after-write)
         return local_path
 
+    def _mirror_to_s3(self, local_path: str, filename: str) -> None:
+        """Upload a saved local file to S3, logging instead of raising on failure."""
+        try:
+            self._save_to_s3(local_path, filename)
+        except Exception as e:
+            # Log but don't fail upload flow; processing will use local file
+            logger.warning("s3_upload_deferred", error=str(e), filename=filename)
+
     def save_upload_local_then_s3(self, file: BinaryIO, filename: str) -> str:
         """Explicit helper to save locally then mirror to S3; returns local path."""
         return self.save_upload(file, filename)
@@ -106,27 +169,24 @@ class StorageService:
         file_path = Path(settings.upload_dir) / filename
         
         with open(file_path, "wb") as f:
-            shutil.copyfileobj(file, f)
+            _copy_to_file(file, f)
         
         logger.info("file_saved_local", path=str(file_path))
         
         return str(file_path)
     
-    def _save_to_s3(self, file: BinaryIO, filename: str) -> str:
-        """Save file to MinIO/S3."""
+    def _save_to_s3(self, local_path: str, filename: str) -> str:
+        """Save a local file to MinIO/S3."""
         object_name = f"uploads/{filename}"
         
         try:
-            # Get file size
-            file.seek(0, os.SEEK_END)
-            file_size = file.tell()
-            file.seek(0)
-            
-            self.client.put_object(
+            # Streams from the path in parts, uploaded as a multipart upload
+            # for anything larger than one part
+            self.client.fput_object(
                 settings.minio_bucket,
                 object_name,
-                file,
-                file_size,
+                local_path,
+                part_size=S3_UPLOAD_PART_SIZE,
             )
             
             logger.info("file_saved_s3", object_name=object_name)
@@ -150,43 +210,41 @@ class StorageService:
         Returns:
             Local file path
         """
-        if storage_path.startswith("s3://"):
-            # Extract object name from S3 URI
-            parts = storage_path.replace("s3://", "").split("/", 1)
-            bucket = parts[0]
-            object_name = parts[1]
-            
-            # Download to local temp directory
-            local_path = Path(settings.upload_dir) / Path(object_name).name
-            
-            # Retry download to tolerate transient S3 propagation delays
-            import time
-            last_err: Exception | None = None
-            for attempt in range(1, 4):
-                try:
-                    self.client.fget_object(bucket, object_name, str(local_path))
-                    logger.info(
-                        "file_downloaded_s3",
-                        object_name=object_name,
-                        attempt=attempt,
-                    )
-                    return str(local_path)
-                except S3Error as e:
-                    last_err = e
-                    logger.warning(
-                        "s3_download_retry",
-                        attempt=attempt,
-                        max_attempts=3,
-                        error=str(e),
-                        object_name=object_name,
-                    )
-                    # Exponential backoff: 0.5s, 1s, 2s
-                    time.sleep(0.5 * (2 ** (attempt - 1)))
-            # After retries, raise the last error
-            logger.error("s3_download_failed", error=str(last_err), object_name=object_name)
-            raise last_err
-        else:
+        if not storage_path.startswith(S3_URI_PREFIX):
             return storage_path
+        
+        # Extract object name from S3 URI
+        bucket, object_name = storage_path[len(S3_URI_PREFIX):].split("/", 1)
+        
+        # Download to local temp directory
+        local_path = Path(settings.upload_dir) / Path(object_name).name
+        
+        # Retry download to tolerate transient S3 propagation delays
+        max_attempts = len(S3_DOWNLOAD_BACKOFF_SECONDS)
+        last_err: Optional[Exception] = None
+        for attempt, backoff in enumerate(S3_DOWNLOAD_BACKOFF_SECONDS, start=1):
+            try:
+                self.client.fget_object(bucket, object_name, str(local_path))
+                logger.info(
+                    "file_downloaded_s3",
+                    object_name=object_name,
+                    attempt=attempt,
+                )
+                return str(local_path)
+            except S3Error as e:
+                last_err = e
+                logger.warning(
+                    "s3_download_retry",
+                    attempt=attempt,
+                    max_attempts=max_attempts,
+                    error=str(e),
+                    object_name=object_name,
+                )
+                # Exponential backoff: 0.5s, 1s, 2s
+                time.sleep(backoff)
+        # After retries, raise the last error
+        logger.error("s3_download_failed", error=str(last_err), object_name=object_name)
+        raise last_err
     
     def delete_file(self, storage_path: str) -> bool:
         """
@@ -199,10 +257,8 @@ class StorageService:
             True if deleted successfully
         """
         try:
-            if storage_path.startswith("s3://"):
-                parts = storage_path.replace("s3://", "").split("/", 1)
-                bucket = parts[0]
-                object_name = parts[1]
+            if storage_path.startswith(S3_URI_PREFIX):
+                bucket, object_name = storage_path[len(S3_URI_PREFIX):].split("/", 1)
                 
                 self.client.remove_object(bucket, object_name)
                 logger.info("file_deleted_s3", object_name=object_name)
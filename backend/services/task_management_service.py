@@ -8,8 +8,10 @@ Extended with job monitoring for desktop mode.
 import os
 import signal
 import subprocess as subprocess_module
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from uuid import UUID
 
 from backend.core.logging import get_logger
@@ -21,6 +23,60 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# How long one pair of inspect() broadcasts answers task lookups, so a burst of
+# cancellations shares a single round trip to the workers
+CELERY_INSPECT_CACHE_TTL_SECONDS = 2.0
+
+# (fetched_at, active job_id -> task_id, scheduled job_id -> task_id)
+_celery_task_index: Tuple[float, Dict[str, str], Dict[str, str]] = (float("-inf"), {}, {})
+_celery_task_index_lock = threading.Lock()
+
+
+def _get_celery_task_index() -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Map job IDs to Celery task IDs for active and scheduled tasks.
+
+    The maps are rebuilt from inspect().active() and inspect().scheduled()
+    at most once per CELERY_INSPECT_CACHE_TTL_SECONDS; concurrent callers
+    wait for the refresh in progress instead of issuing their own.
+    """
+    global _celery_task_index
+
+    with _celery_task_index_lock:
+        fetched_at, active_index, scheduled_index = _celery_task_index
+        if time.monotonic() - fetched_at < CELERY_INSPECT_CACHE_TTL_SECONDS:
+            return active_index, scheduled_index
+
+        inspect = celery_app.control.inspect()
+
+        active_index = {}
+        for tasks in (inspect.active() or {}).values():
+            for task in tasks:
+                args = task.get('args', [])
+                if args:
+                    active_index.setdefault(str(args[0]), task.get('id'))
+
+        scheduled_index = {}
+        for tasks in (inspect.scheduled() or {}).values():
+            for task in tasks:
+                request = task.get('request', {})
+                args = request.get('args', [])
+                if args:
+                    scheduled_index.setdefault(str(args[0]), request.get('id'))
+
+        _celery_task_index = (time.monotonic(), active_index, scheduled_index)
+        return active_index, scheduled_index
+
+
+# How long a worker ping result answers "is a Celery worker consuming?", and how
+# long one ping waits for replies
+CELERY_PING_CACHE_TTL_SECONDS = 10.0
+CELERY_PING_TIMEOUT_SECONDS = 1.0
+
+# (checked_at, whether any worker replied)
+_celery_worker_status: Tuple[float, bool] = (float("-inf"), False)
+_celery_worker_status_lock = threading.Lock()
+
 
 class TaskManagementService:
     """Service for managing task cancellation and process termination."""
@@ -45,12 +101,45 @@ class TaskManagementService:
             logger.warning("celery_task_revoke_failed", task_id=task_id, error=str(e))
             return False
     
+    @staticmethod
+    def celery_worker_available(app) -> bool:
+        """
+        Check whether any worker answers a ping on a Celery app's broker.
+        
+        Publishing to a broker nobody consumes succeeds silently, so callers
+        check this before handing a job to Celery. The answer is reused for
+        CELERY_PING_CACHE_TTL_SECONDS; brokers without broadcast support
+        count as having no worker.
+        
+        Args:
+            app: Celery app the task would be published on
+            
+        Returns:
+            True if at least one worker replied
+        """
+        global _celery_worker_status
+        
+        with _celery_worker_status_lock:
+            checked_at, available = _celery_worker_status
+            if time.monotonic() - checked_at < CELERY_PING_CACHE_TTL_SECONDS:
+                return available
+            
+            try:
+                available = bool(app.control.ping(timeout=CELERY_PING_TIMEOUT_SECONDS))
+            except Exception as e:
+                logger.warning("celery_worker_ping_failed", error=str(e))
+                available = False
+            
+            _celery_worker_status = (time.monotonic(), available)
+            return available
+    
     @staticmethod
     def find_celery_task_id(job_id: UUID) -> Optional[str]:
         """
         Find the Celery task ID for a given job.
         
-        This searches active and scheduled tasks to find the task ID.
+        This searches active and scheduled tasks to find the task ID,
+        using worker task lists at most CELERY_INSPECT_CACHE_TTL_SECONDS old.
         
         Args:
             job_id: Job UUID
@@ -59,30 +148,20 @@ class TaskManagementService:
             Celery task ID if found, None otherwise
         """
         try:
-            inspect = celery_app.control.inspect()
+            job_id_str = str(job_id)
+            active_index, scheduled_index = _get_celery_task_index()
             
             # Check active tasks
-            active = inspect.active()
-            if active:
-                for worker, tasks in active.items():
-                    for task in tasks:
-                        args = task.get('args', [])
-                        if args and len(args) > 0 and str(args[0]) == str(job_id):
-                            task_id = task.get('id')
-                            logger.info("celery_task_found_active", job_id=str(job_id), task_id=task_id)
-                            return task_id
+            task_id = active_index.get(job_id_str)
+            if task_id:
+                logger.info("celery_task_found_active", job_id=job_id_str, task_id=task_id)
+                return task_id
             
             # Check scheduled/reserved tasks
-            scheduled = inspect.scheduled()
-            if scheduled:
-                for worker, tasks in scheduled.items():
-                    for task in tasks:
-                        request = task.get('request', {})
-                        args = request.get('args', [])
-                        if args and len(args) > 0 and str(args[0]) == str(job_id):
-                            task_id = request.get('id')
-                            logger.info("celery_task_found_scheduled", job_id=str(job_id), task_id=task_id)
-                            return task_id
+            task_id = scheduled_index.get(job_id_str)
+            if task_id:
+                logger.info("celery_task_found_scheduled", job_id=job_id_str, task_id=task_id)
+                return task_id
             
             logger.warning("celery_task_not_found", job_id=str(job_id))
             return None
@@ -106,60 +185,64 @@ class TaskManagementService:
             import psutil
             
             job_id_str = str(job_id)
-            terminated_count = 0
+            job_id_prefix = job_id_str.split('-')[0]
+            
+            # One pass over the process table: cmdline and parent PID for every process
+            cmdlines = {}
+            parent_pids = {}
+            for proc in psutil.process_iter(['pid', 'ppid', 'cmdline']):
+                cmdline = proc.info.get('cmdline')
+                cmdlines[proc.info['pid']] = ' '.join(cmdline) if cmdline else ''
+                parent_pids[proc.info['pid']] = proc.info.get('ppid')
             
             # Find processes related to this job
-            for proc in psutil.process_iter(['pid', 'cmdline', 'name']):
+            targets = []
+            for pid, cmdline_str in cmdlines.items():
+                if job_id_str in cmdline_str or (job_id_prefix in cmdline_str and 'fastsurfer' in cmdline_str.lower()):
+                    logger.info(
+                        "fastsurfer_process_found",
+                        job_id=job_id_str,
+                        pid=pid,
+                        cmdline=cmdline_str[:200]
+                    )
+                    targets.append(pid)
+            
+            # Add every descendant of the matched processes (and only of those)
+            children = {}
+            for pid, ppid in parent_pids.items():
+                children.setdefault(ppid, []).append(pid)
+            seen = set(targets)
+            queue = list(targets)
+            while queue:
+                for child in children.get(queue.pop(), []):
+                    if child not in seen:
+                        seen.add(child)
+                        targets.append(child)
+                        queue.append(child)
+            
+            # Terminate the processes
+            terminated = []
+            for pid in targets:
                 try:
-                    cmdline = proc.info.get('cmdline', [])
-                    cmdline_str = ' '.join(cmdline) if cmdline else ''
-                    
-                    # Check if this process is related to our job
-                    if job_id_str in cmdline_str or (job_id_str.split('-')[0] in cmdline_str and 'fastsurfer' in cmdline_str.lower()):
-                        logger.info(
-                            "fastsurfer_process_found",
-                            job_id=job_id_str,
-                            pid=proc.info['pid'],
-                            cmdline=cmdline_str[:200]
-                        )
-                        
-                        # Terminate the process
-                        try:
-                            proc.terminate()
-                            terminated_count += 1
-                        except psutil.NoSuchProcess:
-                            pass
-                        except Exception as e:
-                            logger.warning("fastsurfer_terminate_failed", pid=proc.info['pid'], error=str(e))
-                    
-                    # Also check for parent-child relationships
-                    try:
-                        parent = proc.parent()
-                        if parent:
-                            parent_cmdline = ' '.join(parent.info.get('cmdline', [])) if parent.info.get('cmdline') else ''
-                            if job_id_str in parent_cmdline or 'fastsurfer' in parent_cmdline.lower():
-                                proc.terminate()
-                                terminated_count += 1
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
-                        
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
+                    proc = psutil.Process(pid)
+                    proc.terminate()
+                    terminated.append(proc)
+                except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                    pass
+                except Exception as e:
+                    logger.warning("fastsurfer_terminate_failed", pid=pid, error=str(e))
             
-            if terminated_count > 0:
-                logger.info("fastsurfer_processes_terminated", job_id=job_id_str, count=terminated_count)
+            if terminated:
+                logger.info("fastsurfer_processes_terminated", job_id=job_id_str, count=len(terminated))
                 
-                # Give processes a moment to terminate gracefully
-                import time
-                time.sleep(2)
+                # Give processes up to 2s to terminate gracefully, returning as soon as they have
+                _, still_running = psutil.wait_procs(terminated, timeout=2)
                 
                 # Force kill if still running
-                for proc in psutil.process_iter(['pid', 'cmdline']):
+                for proc in still_running:
                     try:
-                        cmdline = ' '.join(proc.info.get('cmdline', [])) if proc.info.get('cmdline') else ''
-                        if job_id_str in cmdline and 'fastsurfer' in cmdline.lower():
-                            proc.kill()
-                            logger.info("fastsurfer_process_killed", pid=proc.info['pid'])
+                        proc.kill()
+                        logger.info("fastsurfer_process_killed", pid=proc.pid)
                     except (psutil.NoSuchProcess, psutil.AccessDenied):
                         pass
                 
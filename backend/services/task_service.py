@@ -9,10 +9,16 @@ from concurrent.futures import ThreadPoolExecutor, Future
 from typing import Callable, Any, Dict
 import logging
 
+from backend.core.config import get_settings
+
 logger = logging.getLogger(__name__)
 
-# Initialize ThreadPoolExecutor for web application - only 1 concurrent job
-executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="neuroinsight-task")
+# Initialize ThreadPoolExecutor for web application - one thread per job slot
+# (MAX_CONCURRENT_JOBS, default 1), so every claimed job starts right away
+executor = ThreadPoolExecutor(
+    max_workers=max(1, get_settings().max_concurrent_jobs),
+    thread_name_prefix="neuroinsight-task",
+)
 
 
 class TaskResult:
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the FastCORSMiddleware preflight and Vary handling.
+
+Run with: python -m pytest test_cors.py
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+sys.path.insert(0, '.')
+
+pytest.importorskip("pydantic_settings")
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("structlog")
+
+from backend.core.cors import FastCORSMiddleware  # noqa: E402
+
+
+async def _app(scope, receive, send):
+    """Downstream app that answers every request with its own Vary header."""
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"text/plain"), (b"vary", b"Accept-Encoding")],
+    })
+    await send({"type": "http.response.body", "body": b"app"})
+
+
+def _request(middleware, method="GET", headers=()):
+    """Run one request through the middleware; return (status, headers, body)."""
+    scope = {"type": "http", "method": method, "headers": list(headers)}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(middleware(scope, receive, send))
+    start, body = messages
+    return start["status"], start["headers"], body["body"]
+
+
+def _values(headers, name):
+    return [value for key, value in headers if key == name]
+
+
+PREFLIGHT = [
+    (b"origin", b"http://allowed.example"),
+    (b"access-control-request-method", b"POST"),
+    (b"access-control-request-headers", b"x-custom"),
+]
+
+
+def test_preflight_allowed_origin_is_echoed_with_vary():
+    middleware = FastCORSMiddleware(_app, origins=["http://allowed.example"])
+    status, headers, body = _request(middleware, "OPTIONS", PREFLIGHT)
+
+    assert status == 200
+    assert body == b"OK"
+    assert _values(headers, b"access-control-allow-origin") == [b"http://allowed.example"]
+    assert _values(headers, b"access-control-allow-headers") == [b"x-custom"]
+    assert _values(headers, b"vary") == [b"Origin"]
+
+
+def test_preflight_disallowed_origin_is_rejected():
+    middleware = FastCORSMiddleware(_app, origins=["http://allowed.example"])
+    headers = [(b"origin", b"http://other.example"), *PREFLIGHT[1:]]
+    status, response_headers, body = _request(middleware, "OPTIONS", headers)
+
+    assert status == 400
+    assert body == b"Disallowed CORS origin"
+    assert not _values(response_headers, b"access-control-allow-origin")
+
+
+def test_options_without_request_method_is_not_a_preflight():
+    middleware = FastCORSMiddleware(_app, origins=["*"])
+    status, _, body = _request(middleware, "OPTIONS", [(b"origin", b"http://any.example")])
+
+    assert status == 200
+    assert body == b"app"
+
+
+def test_wildcard_without_credentials_sends_star_and_no_vary():
+    middleware = FastCORSMiddleware(_app, origins=["*"])
+    _, headers, _ = _request(middleware, headers=[(b"origin", b"http://any.example")])
+
+    assert _values(headers, b"access-control-allow-origin") == [b"*"]
+    assert _values(headers, b"vary") == [b"Accept-Encoding"]
+
+
+def test_wildcard_with_credentials_echoes_origin_and_adds_vary():
+    middleware = FastCORSMiddleware(_app, origins=["*"], allow_credentials=True)
+    _, headers, _ = _request(middleware, headers=[(b"origin", b"http://any.example")])
+
+    assert _values(headers, b"access-control-allow-origin") == [b"http://any.example"]
+    assert _values(headers, b"access-control-allow-credentials") == [b"true"]
+    # The app's own Vary is kept alongside the one added for Origin
+    assert _values(headers, b"vary") == [b"Accept-Encoding", b"Origin"]
+
+
+def test_disallowed_simple_request_gets_no_cors_headers():
+    middleware = FastCORSMiddleware(_app, origins=["http://allowed.example"])
+    _, headers, body = _request(middleware, headers=[(b"origin", b"http://other.example")])
+
+    assert body == b"app"
+    assert not _values(headers, b"access-control-allow-origin")
+
+
+def test_same_origin_request_passes_through_untouched():
+    middleware = FastCORSMiddleware(_app, origins=["http://allowed.example"])
+    _, headers, _ = _request(middleware)
+
+    assert headers == [(b"content-type", b"text/plain"), (b"vary", b"Accept-Encoding")]
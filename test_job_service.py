@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Unit tests for JobService queries against in-memory SQLite.
+
+Run with: python -m pytest test_job_service.py
+"""
+
+import sys
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, '.')
+
+pytest.importorskip("fastapi")
+pytest.importorskip("numpy")
+pytest.importorskip("pydantic_settings")
+sqlalchemy = pytest.importorskip("sqlalchemy")
+pytest.importorskip("structlog")
+
+from fastapi import HTTPException  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from backend.api.jobs import _decode_cursor, _encode_cursor  # noqa: E402
+from backend.core.database import Base  # noqa: E402
+from backend.models import Job  # noqa: E402
+from backend.models.job import JobStatus  # noqa: E402
+from backend.services.job_service import JobService  # noqa: E402
+from backend.services.task_management_service import TaskManagementService  # noqa: E402
+
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def db():
+    engine = sqlalchemy.create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _add_job(db, job_id, minutes=0, status=JobStatus.PENDING):
+    job = Job(
+        id=job_id,
+        filename=f"{job_id}.nii.gz",
+        status=status,
+        created_at=BASE_TIME + timedelta(minutes=minutes),
+    )
+    db.add(job)
+    db.commit()
+    return job
+
+
+# Keyset pagination
+
+@pytest.mark.parametrize("created_at", [
+    datetime(2026, 1, 2, 3, 4, 5),
+    datetime(2026, 1, 2, 3, 4, 5, 678901),
+])
+def test_cursor_round_trip(created_at):
+    job = SimpleNamespace(created_at=created_at, id="a1b2c3d4")
+
+    assert _decode_cursor(_encode_cursor(job)) == (created_at, "a1b2c3d4")
+
+
+@pytest.mark.parametrize("cursor", ["", "no-separator", "2026-01-02T03:04:05|", "not-a-date|a1b2c3d4"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        _decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_cursor_pages_cover_every_job_once_in_order(db):
+    # Two pairs share a created_at, so paging must break ties on id
+    for job_id, minutes in [("0000000a", 0), ("0000000b", 1), ("0000000c", 1),
+                            ("0000000d", 2), ("0000000e", 3), ("0000000f", 3), ("00000010", 4)]:
+        _add_job(db, job_id, minutes)
+    expected = [job.id for job in JobService.get_jobs(db, limit=100)]
+
+    seen = []
+    cursor = None
+    while True:
+        page = JobService.get_jobs(db, limit=2, cursor=cursor)
+        seen.extend(job.id for job in page)
+        if len(page) < 2:
+            break
+        cursor = (page[-1].created_at, page[-1].id)
+
+    assert seen == expected
+    assert expected[0] == "00000010"
+    assert expected.index("0000000c") < expected.index("0000000b")
+
+
+def test_cursor_pages_respect_status_filter(db):
+    _add_job(db, "0000000a", 0, JobStatus.COMPLETED)
+    _add_job(db, "0000000b", 1, JobStatus.PENDING)
+    _add_job(db, "0000000c", 2, JobStatus.COMPLETED)
+    _add_job(db, "0000000d", 3, JobStatus.COMPLETED)
+
+    first = JobService.get_jobs(db, limit=2, status=JobStatus.COMPLETED)
+    second = JobService.get_jobs(
+        db, limit=2, status=JobStatus.COMPLETED, cursor=(first[-1].created_at, first[-1].id)
+    )
+
+    assert [job.id for job in first] == ["0000000d", "0000000c"]
+    assert [job.id for job in second] == ["0000000a"]
+
+
+# Claiming pending jobs
+
+def test_claim_takes_oldest_pending_job_once(db):
+    _add_job(db, "0000000a", 0)
+    _add_job(db, "0000000b", 1)
+
+    assert JobService.claim_next_pending_job(db, max_concurrent_jobs=1) == "0000000a"
+    # The slot is taken, so nothing else is claimed and the job stays pending
+    assert JobService.claim_next_pending_job(db, max_concurrent_jobs=1) is None
+
+    db.expire_all()
+    assert db.get(Job, "0000000a").status == JobStatus.RUNNING
+    # started_at is left for the worker's start_job call
+    assert db.get(Job, "0000000a").started_at is None
+    assert db.get(Job, "0000000b").status == JobStatus.PENDING
+
+
+def test_claim_fills_free_slots_then_stops(db):
+    _add_job(db, "0000000a", 0)
+    _add_job(db, "0000000b", 1)
+
+    claimed = [JobService.claim_next_pending_job(db, max_concurrent_jobs=3) for _ in range(3)]
+
+    assert claimed == ["0000000a", "0000000b", None]
+
+
+def test_claim_does_not_take_non_pending_jobs(db):
+    _add_job(db, "0000000a", 0, JobStatus.CANCELLED)
+    _add_job(db, "0000000b", 1, JobStatus.COMPLETED)
+
+    assert JobService.claim_next_pending_job(db, max_concurrent_jobs=1) is None
+
+
+def test_claim_without_returning_support(db, monkeypatch):
+    monkeypatch.setattr(db.get_bind().dialect, "update_returning", False)
+    _add_job(db, "0000000a", 0)
+    _add_job(db, "0000000b", 1)
+
+    claimed = [JobService.claim_next_pending_job(db, max_concurrent_jobs=1) for _ in range(2)]
+
+    assert claimed == ["0000000a", None]
+
+
+def test_queue_leaves_job_pending_when_no_worker_answers(db, monkeypatch):
+    monkeypatch.setattr(TaskManagementService, "celery_worker_available", staticmethod(lambda app: False))
+    _add_job(db, "0000000a", 0)
+
+    JobService.process_job_queue(db)
+
+    db.expire_all()
+    assert db.get(Job, "0000000a").status == JobStatus.PENDING
+
+
+# Cancelled job sweep
+
+def test_purge_cancelled_jobs_removes_only_expired_cancellations(db):
+    old = _add_job(db, "0000000a", 0, JobStatus.CANCELLED)
+    old.completed_at = datetime.utcnow() - timedelta(minutes=5)
+    recent = _add_job(db, "0000000b", 1, JobStatus.CANCELLED)
+    recent.completed_at = datetime.utcnow()
+    _add_job(db, "0000000c", 2, JobStatus.COMPLETED)
+    db.commit()
+
+    assert JobService.purge_cancelled_jobs(db, older_than_seconds=60) == 1
+
+    db.expire_all()
+    assert db.get(Job, "0000000a") is None
+    assert db.get(Job, "0000000b") is not None
+    assert db.get(Job, "0000000c") is not None
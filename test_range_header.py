@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Unit tests for HTTP Range header parsing on the NIfTI download endpoints.
+
+Run with: python -m pytest test_range_header.py
+"""
+
+import sys
+
+import pytest
+
+sys.path.insert(0, '.')
+
+pytest.importorskip("fastapi")
+pytest.importorskip("numpy")
+pytest.importorskip("pydantic_settings")
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("structlog")
+
+from fastapi import HTTPException  # noqa: E402
+
+from backend.api.visualizations import _parse_range_header  # noqa: E402
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-99", (0, 99)),
+    ("bytes=100-", (100, 999)),
+    ("bytes=900-5000", (900, 999)),   # end past EOF is clamped
+    ("bytes=-100", (900, 999)),       # suffix: last 100 bytes
+    ("bytes=-5000", (0, 999)),        # suffix longer than the file
+    ("Bytes = 10-19", (10, 19)),
+])
+def test_satisfiable_ranges(header, expected):
+    assert _parse_range_header(header, 1000) == expected
+
+
+@pytest.mark.parametrize("header", [
+    "items=0-99",           # unknown unit
+    "bytes=abc-def",        # not numbers
+    "bytes=0-99,200-299",   # multi-range
+    "bytes=0-99,50-150",    # overlapping multi-range
+])
+def test_ignored_ranges_serve_full_file(header):
+    assert _parse_range_header(header, 1000) is None
+
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=500-100"])
+def test_unsatisfiable_ranges(header):
+    with pytest.raises(HTTPException) as exc_info:
+        _parse_range_header(header, 1000)
+
+    assert exc_info.value.status_code == 416
+    assert exc_info.value.headers["Content-Range"] == "bytes */1000"
@@ -305,35 +305,25 @@ def process_mri_direct(job_id: str):
 
 
 def _start_next_pending_job(db: Session):
-    """Start the next pending job if available and no jobs are currently running"""
+    """Start the next pending job if available and capacity allows"""
     try:
-        from backend.schemas import JobStatus
         from backend.services.task_service import TaskService
 
-        # Check if there are any running jobs
-        running_jobs = JobService.count_jobs_by_status(db, [JobStatus.RUNNING])
-        if running_jobs > 0:
-            logger.info("not_starting_pending_job", reason="jobs_still_running", running_count=running_jobs)
+        # Claim atomically so concurrent callers cannot start the same slot twice
+        job_id = JobService.claim_next_pending_job(db)
+        if job_id is None:
+            logger.info("no_pending_job_started", reason="no_pending_jobs_or_no_free_slot")
             return
 
-        # Find the oldest pending job
-        pending_job = db.query(Job).filter(Job.status == JobStatus.PENDING).order_by(Job.created_at).first()
-        if not pending_job:
-            logger.info("no_pending_jobs_to_start")
-            return
-
-        logger.info("starting_next_pending_job", job_id=str(pending_job.id), filename=pending_job.filename)
-
-        # Mark job as running and submit for processing
-        JobService.start_job(db, str(pending_job.id))
+        logger.info("starting_next_pending_job", job_id=job_id)
 
-        # Submit to task service for processing
+        # Submit to task service for processing (process_mri_direct sets started_at)
         def process_pending_async():
             try:
-                result = process_mri_direct(str(pending_job.id))
-                logger.info("pending_job_completed", job_id=str(pending_job.id), result=result)
+                result = process_mri_direct(job_id)
+                logger.info("pending_job_completed", job_id=job_id, result=result)
             except Exception as e:
-                logger.error("pending_job_failed", job_id=str(pending_job.id), error=str(e), exc_info=True)
+                logger.error("pending_job_failed", job_id=job_id, error=str(e), exc_info=True)
 
         TaskService.submit_task(process_pending_async)
 
@@ -111,42 +111,15 @@ def update_job_progress(db: Session, job_id, progress: int, current_step: str):
 
 def start_next_pending_job(db: Session):
     """
-    Check for pending jobs and start the next one if no jobs are currently running.
+    Check for pending jobs and start the next one if capacity allows.
     
     This ensures automatic job progression after a job completes or fails.
+    The job is claimed atomically by JobService before it is dispatched.
     
     Args:
         db: Database session
     """
-    try:
-        # Check if there are any running jobs
-        running_count = JobService.count_jobs_by_status(db, [JobStatus.RUNNING])
-        
-        if running_count > 0:
-            logger.info("job_already_running_skipping_auto_start", running_count=running_count)
-            return
-        
-        # Get the oldest pending job (FIFO queue)
-        pending_job = db.query(Job).filter(
-            Job.status == JobStatus.PENDING
-        ).order_by(Job.created_at.asc()).first()
-        
-        if not pending_job:
-            logger.info("no_pending_jobs_found")
-            return
-        
-        # Start the pending job
-        logger.info("auto_starting_next_pending_job", job_id=str(pending_job.id), filename=pending_job.filename)
-        
-        # Submit to Celery queue
-        task = process_mri_task.delay(str(pending_job.id))
-        logger.info("auto_started_pending_job", 
-                   job_id=str(pending_job.id), 
-                   celery_task_id=task.id,
-                   filename=pending_job.filename)
-        
-    except Exception as e:
-        logger.error("failed_to_auto_start_pending_job", error=str(e), exc_info=True)
+    JobService.process_job_queue(db)
 
 
 @celery_app.task(bind=True, name="process_mri_task")
@@ -184,14 +157,9 @@ def process_mri_task(self, job_id: str):
 
             # Only update if progress increased by at least 5%
             if progress >= last_reported_progress + 5 or progress >= 100:
+                # update_job_progress logs the step as progress_updated
                 update_job_progress(db, job_id, progress, step)
                 last_reported_progress = progress
-                logger.info(
-                    "processing_progress",
-                    job_id=job_id,
-                    progress=progress,
-                    step=step
-                )
 
         # Initialize MRI processor with progress callback and database session
         print(f"DEBUG: Celery task initializing MRI processor for job {job_id}")